@@ -5,30 +5,237 @@ Detailed video metrics, engagement analytics, and performance indicators
 """
 
 import os
-import requests
+import sys
+import atexit
 import sqlite3
+import logging
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime, timedelta
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, g
 from googleapiclient.discovery import build
 import ollama
 import re
+import heapq
+import queue
+import time
+import numpy as np
+from collections import Counter
+from functools import lru_cache, wraps
+from operator import itemgetter
+from typing import NamedTuple
+from threading import RLock, Lock, Thread, local
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache
+from cachetools.keys import hashkey
 
 app = Flask(__name__)
+logger = logging.getLogger(__name__)
+
+_log_listener = None
+_log_lock = Lock()
+
+def setup_logging():
+    """Log through a queue so request threads never block on terminal writes
+    
+    Runs at import so gunicorn workers (which import analytics_api:app) log too.
+    Safe to call more than once; does nothing if the host already configured logging.
+    The listener is stopped at exit, flushing queued records.
+    """
+    global _log_listener
+    with _log_lock:
+        if _log_listener is not None or logging.getLogger().handlers:
+            return
+        
+        log_queue = queue.Queue()
+        logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+        _log_listener = QueueListener(log_queue, logging.StreamHandler())
+        _log_listener.start()
+        atexit.register(stop_logging)
+
+def stop_logging():
+    """Flush queued log records and stop the listener; safe to call more than once"""
+    global _log_listener
+    with _log_lock:
+        listener, _log_listener = _log_listener, None
+    if listener is not None:
+        listener.stop()
+
+setup_logging()
 
 # Configuration
 YOUTUBE_API_KEY = os.environ.get("YOUTUBE_API_KEY", "YOUR_API_KEY")
 OLLAMA_MODEL = "llama2:7b"
 DB_NAME = "youtube_analytics.db"
+CHANNEL_DB_NAME = "analytics.db"
+CHANNEL_WRITE_BATCH = 50  # Max records per background write
+CHANNEL_WRITE_INTERVAL = 0.2  # Seconds to wait for a batch to fill
+CHANNEL_WRITE_QUEUE_MAX = 10000  # Pending records beyond this are dropped, not buffered
+SENTIMENT_BATCH_SIZE = 32
+API_CACHE_TTL = 900  # Seconds to reuse YouTube API responses
+
+# Analytics INSERT statements, kept constant so the connection's statement cache reuses them
+_INSERT_VIDEO_SQL = '''
+    INSERT OR REPLACE INTO video_analytics 
+    (video_id, title, channel, channel_id, published_at, duration, category,
+     view_count, like_count, dislike_count, comment_count, engagement_rate,
+     like_ratio, comment_ratio)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+_INSERT_COMMENT_SQL = '''
+    INSERT INTO comment_analytics 
+    (video_id, total_comments, positive_count, negative_count, neutral_count,
+     question_count, spam_count, avg_comment_length, top_keywords, sentiment_score)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+_INSERT_PERFORMANCE_SQL = '''
+    INSERT INTO performance_metrics 
+    (video_id, views_per_day, likes_per_day, comments_per_day, growth_rate,
+     viral_score, audience_retention, click_through_rate)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+_INSERT_CHANNEL_SQL_PREFIX = '''
+    INSERT INTO channel_analytics 
+    (channel_id, title, subscriber_count, video_count, view_count, engagement_rate, avg_views_per_video)
+    VALUES '''
+_CHANNEL_ROW_PLACEHOLDERS = "(?, ?, ?, ?, ?, ?, ?)"
+# Rows per multi-row INSERT, keeping bound parameters under SQLite's default limit of 999
+CHANNEL_INSERT_BATCH = 999 // 7
+
+_ISO_DURATION_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+_BATCH_LABEL_RE = re.compile(r'^\s*(\d+)\s*[.):-]?\s*\**\s*(POSITIVE|NEGATIVE|NEUTRAL)')
+
+# Comment category keywords, matched against whole tokens
+_TOKEN_RE = re.compile(r'\w+|[^\w\s]')  # Words, plus single symbols such as emoji
+_APPRECIATION = frozenset({'great', 'awesome', 'love', 'amazing', 'perfect', 'excellent', 'fantastic', 'brilliant', 'wonderful', 'outstanding'})
+_CRITICISM = frozenset({'bad', 'terrible', 'awful', 'hate', 'dislike', 'worst', 'garbage', 'trash', 'boring', 'disappointing'})
+_SUGGESTION = frozenset({'should', 'could', 'would', 'suggest', 'recommend', 'maybe', 'perhaps', 'consider', 'try'})
+_FEEDBACK = frozenset({'feedback', 'review', 'thought', 'opinion', 'think', 'feel', 'experience'})
+_SPAM_WORDS = frozenset({'subscribe', 'like', 'comment', 'free'})
+_SPAM_PHRASE_RE = re.compile(r'\b(?:check out my channel|follow me|watch my video|click here)\b')
+_HUMOR = frozenset({'lol', 'haha', 'funny', 'joke', 'hilarious', 'comedy', '😂', '🤣', '😄'})
+_TECHNICAL = frozenset({'how', 'what', 'when', 'where', 'why', 'setup', 'config', 'install', 'error', 'problem', 'solution'})
+_PERSONAL = frozenset({'i', 'me', 'my', 'myself', 'personal', 'experience', 'story', 'life'})
+
+def _is_spam_tokens(word_set, text_lower):
+    """Check tokenized, lowercased text for spam words or phrases"""
+    return not _SPAM_WORDS.isdisjoint(word_set) or _SPAM_PHRASE_RE.search(text_lower) is not None
 
 # Initialize services
-youtube = build("youtube", "v3", developerKey=YOUTUBE_API_KEY)
+_youtube_local = local()
+
+def get_youtube():
+    """YouTube API client for the calling thread (httplib2 transports are not thread-safe)"""
+    client = getattr(_youtube_local, 'client', None)
+    if client is None:
+        client = _youtube_local.client = build("youtube", "v3", developerKey=YOUTUBE_API_KEY)
+    return client
+
 ollama_client = ollama.Client()
 
+# YouTube API response caches
+_VIDEO_CACHE = TTLCache(maxsize=10000, ttl=API_CACHE_TTL)
+_COMMENT_CACHE = TTLCache(maxsize=10000, ttl=API_CACHE_TTL)
+_CHANNEL_CACHE = TTLCache(maxsize=10000, ttl=API_CACHE_TTL)
+_CHANNEL_ANALYTICS_CACHE = TTLCache(maxsize=2048, ttl=API_CACHE_TTL)
+_CACHE_LOCK = RLock()
+
+# Worker pool for overlapping independent YouTube API round-trips
+_EXEC = ThreadPoolExecutor(max_workers=8)
+atexit.register(_EXEC.shutdown, wait=False)
+
+# Separate long-lived pool for channel comparison fan-out; its tasks wait on _EXEC,
+# and keeping the threads alive keeps their per-thread YouTube clients warm
+_CHANNEL_EXEC = ThreadPoolExecutor(max_workers=8, thread_name_prefix='channel-compare')
+atexit.register(_CHANNEL_EXEC.shutdown, wait=False)
+
+def _ttl_cached(cache):
+    """Cache successful results by call arguments; error results are never cached"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = hashkey(*args, **kwargs)
+            with _CACHE_LOCK:
+                result = cache.get(key)
+            if result is not None:
+                return result
+            
+            result = func(*args, **kwargs)
+            if result and 'error' not in result:
+                with _CACHE_LOCK:
+                    cache[key] = result
+            return result
+        
+        def cache_clear():
+            with _CACHE_LOCK:
+                cache.clear()
+        
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+def get_db():
+    """Get the SQLite connection for the current app context"""
+    if 'db' not in g:
+        # Autocommit mode; writers open their own explicit transactions
+        g.db = sqlite3.connect(DB_NAME, check_same_thread=False, isolation_level=None, cached_statements=256)
+        g.db.execute("PRAGMA journal_mode=WAL")
+        g.db.execute("PRAGMA synchronous=NORMAL")
+        g.db.execute("PRAGMA cache_size=-65536")
+        g.db.execute("PRAGMA temp_store=MEMORY")
+        g.db.row_factory = sqlite3.Row
+    return g.db
+
+@app.teardown_appcontext
+def close_db(exception=None):
+    """Close the app-context SQLite connection"""
+    db = g.pop('db', None)
+    if db is not None:
+        db.close()
+
+def _open_channel_conn():
+    """Open the writer thread's channel analytics connection with its per-connection pragmas"""
+    # Autocommit mode; the writer opens its own explicit transactions.
+    # journal_mode=WAL is persistent and set by init_channel_db; the rest are per-connection
+    conn = sqlite3.connect(CHANNEL_DB_NAME, isolation_level=None, cached_statements=256)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-65536")
+    return conn
+
+def init_channel_db():
+    """Create the channel analytics schema; safe to call repeatedly"""
+    conn = sqlite3.connect(CHANNEL_DB_NAME)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS channel_analytics (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            channel_id TEXT,
+            title TEXT,
+            subscriber_count INTEGER,
+            video_count INTEGER,
+            view_count INTEGER,
+            engagement_rate REAL,
+            avg_views_per_video REAL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    
+    # Index for per-channel, newest-first lookups
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_channel_created ON channel_analytics(channel_id, created_at DESC)")
+    conn.commit()
+    conn.close()
+
 def init_db():
     """Initialize comprehensive database"""
     conn = sqlite3.connect(DB_NAME)
     cursor = conn.cursor()
     
+    # WAL journal with relaxed sync keeps commits from forcing an fsync each time
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    
     # Main analytics table
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS video_analytics (
@@ -88,64 +295,118 @@ def init_db():
             FOREIGN KEY (video_id) REFERENCES video_analytics (video_id)
         )
     ''')
-    
+
+    # Indexes for the /history join and its newest-first ordering
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_comment_video ON comment_analytics(video_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_performance_video ON performance_metrics(video_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_video_analyzed_at ON video_analytics(analyzed_at DESC)")
+
+    # Refresh planner statistics so the indexes above get picked
+    cursor.execute("ANALYZE")
+
     conn.commit()
     conn.close()
+    
+    # Channel analytics live in their own database
+    init_channel_db()
 
+@_ttl_cached(_VIDEO_CACHE)
 def get_detailed_video_info(video_id):
     """Get comprehensive video information"""
     try:
-        response = youtube.videos().list(
+        response = get_youtube().videos().list(
             part="snippet,statistics,contentDetails",
             id=video_id
         ).execute()
         
         if not response['items']:
             return None
-            
-        video = response['items'][0]
-        snippet = video['snippet']
-        statistics = video['statistics']
-        content_details = video['contentDetails']
-        
-        # Calculate engagement metrics
-        view_count = int(statistics.get('viewCount', 0))
-        like_count = int(statistics.get('likeCount', 0))
-        comment_count = int(statistics.get('commentCount', 0))
         
-        engagement_rate = ((like_count + comment_count) / view_count * 100) if view_count > 0 else 0
-        like_ratio = (like_count / view_count * 100) if view_count > 0 else 0
-        comment_ratio = (comment_count / view_count * 100) if view_count > 0 else 0
-        
-        # Parse duration
-        duration = content_details.get('duration', 'PT0S')
-        duration_seconds = parse_duration(duration)
-        
-        return {
-            'title': snippet['title'],
-            'channel': snippet['channelTitle'],
-            'channel_id': snippet['channelId'],
-            'published_at': snippet['publishedAt'],
-            'duration': duration,
-            'duration_seconds': duration_seconds,
-            'category': snippet.get('categoryId'),
-            'view_count': view_count,
-            'like_count': like_count,
-            'dislike_count': int(statistics.get('dislikeCount', 0)),
-            'comment_count': comment_count,
-            'engagement_rate': round(engagement_rate, 2),
-            'like_ratio': round(like_ratio, 2),
-            'comment_ratio': round(comment_ratio, 2),
-            'tags': snippet.get('tags', []),
-            'description': snippet.get('description', '')[:500],
-            'thumbnail': snippet['thumbnails']['high']['url']
-        }
+        return _parse_video_item(response['items'][0])
     except Exception as e:
         return {"error": str(e)}
 
+def get_detailed_video_info_batch(video_ids):
+    """Get comprehensive video information for up to 50 videos in one API call"""
+    videos = {}
+    missing_ids = []
+    
+    # Serve what we can from the per-video cache
+    with _CACHE_LOCK:
+        for video_id in video_ids[:50]:
+            cached_video = _VIDEO_CACHE.get(hashkey(video_id))
+            if cached_video is not None:
+                videos[video_id] = cached_video
+            else:
+                missing_ids.append(video_id)
+    
+    if not missing_ids:
+        return videos
+    
+    try:
+        response = get_youtube().videos().list(
+            part="snippet,statistics,contentDetails",
+            id=",".join(missing_ids)
+        ).execute()
+        
+        for item in response['items']:
+            try:
+                videos[item['id']] = _parse_video_item(item)
+            except Exception as e:
+                logger.error(f"Error parsing video {item.get('id')}: {e}")
+        
+        with _CACHE_LOCK:
+            for video_id in missing_ids:
+                if video_id in videos:
+                    _VIDEO_CACHE[hashkey(video_id)] = videos[video_id]
+        return videos
+    except Exception as e:
+        logger.error(f"Error fetching video batch: {e}")
+        return videos
+
+def _parse_video_item(video):
+    """Build the video info dict from a videos.list item"""
+    snippet = video['snippet']
+    statistics = video['statistics']
+    content_details = video['contentDetails']
+    
+    # Calculate engagement metrics
+    view_count = int(statistics.get('viewCount', 0))
+    like_count = int(statistics.get('likeCount', 0))
+    comment_count = int(statistics.get('commentCount', 0))
+    
+    engagement_rate = ((like_count + comment_count) / view_count * 100) if view_count > 0 else 0
+    like_ratio = (like_count / view_count * 100) if view_count > 0 else 0
+    comment_ratio = (comment_count / view_count * 100) if view_count > 0 else 0
+    
+    # Parse duration
+    duration = content_details.get('duration', 'PT0S')
+    duration_seconds = parse_duration(duration)
+    
+    return {
+        'title': snippet['title'],
+        'channel': snippet['channelTitle'],
+        'channel_id': snippet['channelId'],
+        'published_at': snippet['publishedAt'],
+        'duration': duration,
+        'duration_seconds': duration_seconds,
+        'category': snippet.get('categoryId'),
+        'view_count': view_count,
+        'like_count': like_count,
+        'dislike_count': int(statistics.get('dislikeCount', 0)),
+        'comment_count': comment_count,
+        'engagement_rate': round(engagement_rate, 2),
+        'like_ratio': round(like_ratio, 2),
+        'comment_ratio': round(comment_ratio, 2),
+        'tags': snippet.get('tags', []),
+        'description': snippet.get('description', '')[:500],
+        'thumbnail': snippet['thumbnails']['high']['url']
+    }
+
+@lru_cache(maxsize=50000)
 def parse_duration(duration):
     """Parse ISO 8601 duration to seconds"""
-    match = re.match(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', duration)
+    match = _ISO_DURATION_RE.match(duration)
     if match:
         hours = int(match.group(1) or 0)
         minutes = int(match.group(2) or 0)
@@ -153,72 +414,124 @@ def parse_duration(duration):
         return hours * 3600 + minutes * 60 + seconds
     return 0
 
-def get_comprehensive_comments(video_id, max_results=100):
-    """Get detailed comment analysis with categorization and overview"""
-    try:
-        response = youtube.commentThreads().list(
+def _iter_comment_snippets(video_id, page_size, max_pages=2):
+    """Yield (text, author, likes) for top-level comments, fetching pages lazily
+    
+    page_size() is called before each page and returns how many comments to
+    request; a value of 0 or less stops paging.
+    """
+    next_page_token = None
+    
+    for _ in range(max_pages):
+        size = min(page_size(), 100)
+        if size <= 0:
+            break
+        response = get_youtube().commentThreads().list(
             part="snippet",
             videoId=video_id,
-            maxResults=max_results,
+            maxResults=size,
+            pageToken=next_page_token,
             order="relevance"
         ).execute()
         
-        if not response['items']:
-            return {"total_comments": 0, "comments": []}
+        for item in response['items']:
+            snippet = item['snippet']['topLevelComment']['snippet']
+            yield snippet['textDisplay'], snippet['authorDisplayName'], snippet.get('likeCount', 0)
         
-        comments = []
-        positive = negative = neutral = questions = spam = 0
+        next_page_token = response.get('nextPageToken')
+        if not next_page_token:
+            break
+
+@_ttl_cached(_COMMENT_CACHE)
+def get_comprehensive_comments(video_id, max_results=100):
+    """Get detailed comment analysis with categorization and overview"""
+    try:
+        # Per-comment fields are kept in parallel lists; dicts are only built for the output views
+        texts, authors, likes, is_questions, is_spams, categories, question_types = [], [], [], [], [], [], []
+        questions = spam = 0
         total_length = 0
-        keywords = {}
-        
-        for item in response['items']:
-            comment_data = item['snippet']['topLevelComment']['snippet']
-            comment_text = comment_data['textDisplay']
-            
-            # Sentiment analysis
-            sentiment = analyze_sentiment_simple(comment_text)
-            if sentiment == "POSITIVE":
-                positive += 1
-            elif sentiment == "NEGATIVE":
-                negative += 1
-            else:
-                neutral += 1
+        keywords = Counter()
+        
+        # Later pages only request the shortfall of non-spam comments
+        shortfall = lambda: max_results - (len(texts) - spam)
+        for comment_text, author, like_count in _iter_comment_snippets(video_id, shortfall):
+            text_lower = comment_text.lower()
+            tokens = _TOKEN_RE.findall(text_lower)
+            word_set = set(tokens)
             
             # Question detection
-            if '?' in comment_text:
+            is_question = '?' in comment_text
+            if is_question:
                 questions += 1
             
             # Spam detection
-            if is_spam_comment(comment_text):
+            is_spam = _is_spam_tokens(word_set, text_lower)
+            if is_spam:
                 spam += 1
             
             # Keyword extraction
-            words = re.findall(r'\b\w+\b', comment_text.lower())
-            for word in words:
-                if len(word) > 3:
-                    keywords[word] = keywords.get(word, 0) + 1
+            keywords.update(token for token in tokens if len(token) >= 4)
             
             total_length += len(comment_text)
             
-            comments.append({
-                "text": comment_text[:200],
-                "author": comment_data['authorDisplayName'],
-                "likes": comment_data.get('likeCount', 0),
-                "sentiment": sentiment,
-                "is_question": '?' in comment_text,
-                "is_spam": is_spam_comment(comment_text)
-            })
+            # Categorize on the displayed (truncated) text, reusing the tokens when possible
+            if len(comment_text) <= 200:
+                category, question_type = categorize_comment_text(text_lower, word_set)
+            else:
+                category, question_type = categorize_comment_text(comment_text[:200].lower())
+            
+            texts.append(comment_text)
+            authors.append(author)
+            likes.append(like_count)
+            is_questions.append(is_question)
+            is_spams.append(is_spam)
+            categories.append(category)
+            question_types.append(question_type)
+            
+            if len(texts) - spam >= max_results:
+                break
+        
+        if not texts:
+            return {"total_comments": 0, "comments": []}
+        
+        # Sentiment analysis, batched into a few model calls
+        sentiments = analyze_sentiment_batch(texts)
+        sentiment_counts = Counter(sentiments)
+        positive = sentiment_counts["POSITIVE"]
+        negative = sentiment_counts["NEGATIVE"]
+        neutral = len(sentiments) - positive - negative
+        
+        views = {}
+        def comment_view(index):
+            """Build (once) the user-facing dict for one comment"""
+            comment = views.get(index)
+            if comment is None:
+                comment = {
+                    "text": texts[index][:200],
+                    "author": authors[index],
+                    "likes": likes[index],
+                    "sentiment": sentiments[index],
+                    "is_question": is_questions[index],
+                    "is_spam": is_spams[index]
+                }
+                if question_types[index]:
+                    comment["question_type"] = question_types[index]
+                comment["category"] = categories[index]
+                views[index] = comment
+            return comment
         
         # Calculate basic metrics
-        avg_length = total_length / len(comments) if comments else 0
-        top_keywords = sorted(keywords.items(), key=lambda x: x[1], reverse=True)[:10]
-        sentiment_score = (positive - negative) / len(comments) if comments else 0
+        total = len(texts)
+        avg_length = total_length / total
+        top_keywords = keywords.most_common(10)
+        sentiment_score = (positive - negative) / total
         
         # Generate comprehensive comment overview
-        comment_overview = analyze_comment_overview(comments)
+        categorization = tally_comment_categories(categories, question_types)
+        comment_overview = build_comment_overview(categorization, likes, comment_view)
         
         return {
-            "total_comments": len(comments),
+            "total_comments": total,
             "positive_count": positive,
             "negative_count": negative,
             "neutral_count": neutral,
@@ -227,7 +540,7 @@ def get_comprehensive_comments(video_id, max_results=100):
             "avg_comment_length": round(avg_length, 1),
             "top_keywords": [word for word, count in top_keywords],
             "sentiment_score": round(sentiment_score, 3),
-            "comments": comments[:20],  # Return first 20 for demo
+            "comments": [comment_view(i) for i in range(min(20, total))],  # Return first 20 for demo
             "comment_overview": comment_overview  # New comprehensive overview
         }
     except Exception as e:
@@ -250,14 +563,44 @@ def analyze_sentiment_simple(text):
     except:
         return "NEUTRAL"
 
+def analyze_sentiment_batch(texts, batch_size=SENTIMENT_BATCH_SIZE):
+    """Sentiment analysis for many texts using one Ollama call per batch"""
+    labels = []
+    for start in range(0, len(texts), batch_size):
+        batch = texts[start:start + batch_size]
+        batch_labels = [None] * len(batch)
+        try:
+            numbered = "\n".join(f"{i + 1}. {' '.join(text[:300].split())}" for i, text in enumerate(batch))
+            prompt = (
+                "Analyze the sentiment of each numbered comment. For each comment output one line "
+                "in the form 'NUMBER. LABEL' where LABEL is POSITIVE, NEGATIVE, or NEUTRAL.\n\n"
+                f"{numbered}\n\nSentiments:"
+            )
+            response = ollama_client.chat(model=OLLAMA_MODEL, messages=[
+                {"role": "user", "content": prompt}
+            ])
+            for line in response['message']['content'].upper().splitlines():
+                match = _BATCH_LABEL_RE.match(line)
+                if match:
+                    index = int(match.group(1)) - 1
+                    if 0 <= index < len(batch):
+                        batch_labels[index] = match.group(2)
+        except Exception as e:
+            # The model is unreachable or failed; per-comment calls would fail the same way
+            logger.warning(f"Sentiment batch failed, defaulting {len(batch)} comments to NEUTRAL: {e}")
+            labels.extend(label or "NEUTRAL" for label in batch_labels)
+            continue
+        
+        # Fall back to one call per comment for anything the batch missed
+        for i, label in enumerate(batch_labels):
+            labels.append(label or analyze_sentiment_simple(batch[i]))
+    return labels
+
+@lru_cache(maxsize=50000)
 def is_spam_comment(text):
     """Detect spam comments"""
-    spam_indicators = [
-        'subscribe', 'like', 'comment', 'check out my channel',
-        'follow me', 'watch my video', 'click here', 'free'
-    ]
     text_lower = text.lower()
-    return any(indicator in text_lower for indicator in spam_indicators)
+    return _is_spam_tokens(set(_TOKEN_RE.findall(text_lower)), text_lower)
 
 def calculate_performance_metrics(video_data, comment_data):
     """Calculate performance and growth metrics"""
@@ -292,19 +635,21 @@ def calculate_performance_metrics(video_data, comment_data):
         return {"error": str(e)}
 
 def save_comprehensive_analytics(video_id, video_data, comment_data, performance_data):
-    """Save all analytics to database"""
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
+    """Save all analytics for a single video to database"""
+    return save_comprehensive_analytics_batch([(video_id, video_data, comment_data, performance_data)])
+
+def save_comprehensive_analytics_batch(rows):
+    """Save analytics for many videos in one transaction
+
+    rows is a list of (video_id, video_data, comment_data, performance_data) tuples.
+    analyzed_at is filled in by the schema's CURRENT_TIMESTAMP default.
+    """
+    video_rows = []
+    comment_rows = []
+    performance_rows = []
     
-    try:
-        # Save video analytics
-        cursor.execute('''
-            INSERT OR REPLACE INTO video_analytics 
-            (video_id, title, channel, channel_id, published_at, duration, category,
-             view_count, like_count, dislike_count, comment_count, engagement_rate,
-             like_ratio, comment_ratio, analyzed_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+    for video_id, video_data, comment_data, performance_data in rows:
+        video_rows.append((
             video_id,
             video_data.get('title'),
             video_data.get('channel'),
@@ -318,17 +663,9 @@ def save_comprehensive_analytics(video_id, video_data, comment_data, performance
             video_data.get('comment_count'),
             video_data.get('engagement_rate'),
             video_data.get('like_ratio'),
-            video_data.get('comment_ratio'),
-            datetime.now()
+            video_data.get('comment_ratio')
         ))
-        
-        # Save comment analytics
-        cursor.execute('''
-            INSERT INTO comment_analytics 
-            (video_id, total_comments, positive_count, negative_count, neutral_count,
-             question_count, spam_count, avg_comment_length, top_keywords, sentiment_score, analyzed_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        comment_rows.append((
             video_id,
             comment_data.get('total_comments', 0),
             comment_data.get('positive_count', 0),
@@ -338,17 +675,9 @@ def save_comprehensive_analytics(video_id, video_data, comment_data, performance
             comment_data.get('spam_count', 0),
             comment_data.get('avg_comment_length', 0),
             ','.join(comment_data.get('top_keywords', [])),
-            comment_data.get('sentiment_score', 0),
-            datetime.now()
+            comment_data.get('sentiment_score', 0)
         ))
-        
-        # Save performance metrics
-        cursor.execute('''
-            INSERT INTO performance_metrics 
-            (video_id, views_per_day, likes_per_day, comments_per_day, growth_rate,
-             viral_score, audience_retention, click_through_rate, analyzed_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        performance_rows.append((
             video_id,
             performance_data.get('views_per_day', 0),
             performance_data.get('likes_per_day', 0),
@@ -356,22 +685,79 @@ def save_comprehensive_analytics(video_id, video_data, comment_data, performance
             performance_data.get('growth_rate', 0),
             performance_data.get('viral_score', 0),
             performance_data.get('audience_retention', 0),
-            performance_data.get('click_through_rate', 0),
-            datetime.now()
+            performance_data.get('click_through_rate', 0)
         ))
+    
+    conn = get_db()
+    cursor = conn.cursor()
+    
+    try:
+        # One explicit transaction so all rows share a single commit
+        cursor.execute("BEGIN IMMEDIATE")
+        
+        # Save video analytics
+        cursor.executemany(_INSERT_VIDEO_SQL, video_rows)
+        
+        # Save comment analytics
+        cursor.executemany(_INSERT_COMMENT_SQL, comment_rows)
+        
+        # Save performance metrics
+        cursor.executemany(_INSERT_PERFORMANCE_SQL, performance_rows)
         
         conn.commit()
         return True
         
     except Exception as e:
-        print(f"Database error: {e}")
+        conn.rollback()
+        logger.error(f"Database error: {e}")
         return False
-    finally:
-        conn.close()
 
-def categorize_comments(comments):
-    """Categorize comments into different types"""
-    categories = {
+def categorize_comment_text(text_lower, word_set=None):
+    """Return the category and question type (or None) for lowercased comment text"""
+    if word_set is None:
+        word_set = set(_TOKEN_RE.findall(text_lower))
+    
+    # Appreciation
+    if not _APPRECIATION.isdisjoint(word_set):
+        return "appreciation", None
+    
+    # Criticism
+    elif not _CRITICISM.isdisjoint(word_set):
+        return "criticism", None
+    
+    # Questions
+    elif '?' in text_lower:
+        return "questions", categorize_question(text_lower)
+    
+    # Suggestions
+    elif not _SUGGESTION.isdisjoint(word_set):
+        return "suggestions", None
+    
+    # Feedback
+    elif not _FEEDBACK.isdisjoint(word_set):
+        return "feedback", None
+    
+    # Spam
+    elif _is_spam_tokens(word_set, text_lower):
+        return "spam", None
+    
+    # Humor
+    elif not _HUMOR.isdisjoint(word_set):
+        return "humor", None
+    
+    # Technical
+    elif not _TECHNICAL.isdisjoint(word_set):
+        return "technical", None
+    
+    # Personal
+    elif not _PERSONAL.isdisjoint(word_set):
+        return "personal", None
+    
+    return "other", None
+
+def tally_comment_categories(categories, question_types):
+    """Count comment categories and question types from parallel lists"""
+    category_counts = {
         "appreciation": 0,
         "criticism": 0,
         "questions": 0,
@@ -384,7 +770,7 @@ def categorize_comments(comments):
         "other": 0
     }
     
-    question_types = {
+    question_type_counts = {
         "how_to": 0,
         "what_is": 0,
         "when_will": 0,
@@ -393,66 +779,39 @@ def categorize_comments(comments):
         "general": 0
     }
     
-    categorized_comments = []
+    for category, question_type in zip(categories, question_types):
+        category_counts[category] += 1
+        if question_type:
+            question_type_counts[question_type] += 1
+    
+    return {
+        "categories": category_counts,
+        "question_types": question_type_counts
+    }
+
+def categorize_comments(comments):
+    """Categorize comments into different types"""
+    categories = []
+    question_types = []
     
     for comment in comments:
-        text = comment.get("text", "").lower()
-        category = "other"
-        
-        # Appreciation
-        appreciation_words = ['great', 'awesome', 'love', 'amazing', 'perfect', 'excellent', 'fantastic', 'brilliant', 'wonderful', 'outstanding']
-        if any(word in text for word in appreciation_words):
-            category = "appreciation"
-        
-        # Criticism
-        elif any(word in text for word in ['bad', 'terrible', 'awful', 'hate', 'dislike', 'worst', 'garbage', 'trash', 'boring', 'disappointing']):
-            category = "criticism"
-        
-        # Questions
-        elif '?' in text:
-            category = "questions"
-            question_type = categorize_question(text)
-            question_types[question_type] += 1
-        
-        # Suggestions
-        elif any(word in text for word in ['should', 'could', 'would', 'suggest', 'recommend', 'maybe', 'perhaps', 'consider', 'try']):
-            category = "suggestions"
-        
-        # Feedback
-        elif any(word in text for word in ['feedback', 'review', 'thought', 'opinion', 'think', 'feel', 'experience']):
-            category = "feedback"
-        
-        # Spam
-        elif any(word in text for word in ['subscribe', 'like', 'comment', 'check out my channel', 'follow me', 'watch my video', 'click here', 'free']):
-            category = "spam"
-        
-        # Humor
-        elif any(word in text for word in ['lol', 'haha', 'funny', 'joke', 'hilarious', 'comedy', '😂', '🤣', '😄']):
-            category = "humor"
-        
-        # Technical
-        elif any(word in text for word in ['how', 'what', 'when', 'where', 'why', 'setup', 'config', 'install', 'error', 'problem', 'solution']):
-            category = "technical"
-        
-        # Personal
-        elif any(word in text for word in ['i', 'me', 'my', 'myself', 'personal', 'experience', 'story', 'life']):
-            category = "personal"
-        
-        categories[category] += 1
-        
-        # Add category to comment
-        comment["category"] = category
-        if category == "questions":
-            comment["question_type"] = categorize_question(text)
+        category = comment.get("category")
+        if category is None:
+            category, question_type = categorize_comment_text(comment.get("text", "").lower())
+            if question_type:
+                comment["question_type"] = question_type
+            
+            # Add category to comment
+            comment["category"] = category
         
-        categorized_comments.append(comment)
+        categories.append(category)
+        question_types.append(comment.get("question_type") if category == "questions" else None)
     
-    return {
-        "categories": categories,
-        "question_types": question_types,
-        "categorized_comments": categorized_comments
-    }
+    categorization = tally_comment_categories(categories, question_types)
+    categorization["categorized_comments"] = comments
+    return categorization
 
+@lru_cache(maxsize=50000)
 def categorize_question(text):
     """Categorize question types"""
     text_lower = text.lower()
@@ -484,19 +843,35 @@ def analyze_comment_overview(comments):
     # Categorize comments
     categorization = categorize_comments(comments)
     
-    # Calculate engagement metrics
-    total_likes = sum(c.get("likes", 0) for c in comments)
-    avg_likes = total_likes / len(comments) if comments else 0
+    return build_comment_overview(
+        categorization,
+        [comment.get("likes", 0) for comment in comments],
+        comments.__getitem__
+    )
+
+def build_comment_overview(categorization, likes, comment_view):
+    """Build the comment overview from category tallies, per-comment likes and a view lookup"""
+    total_comments = len(likes)
     
-    # Find most engaging comments
-    sorted_comments = sorted(comments, key=lambda x: x.get("likes", 0), reverse=True)
-    top_comments = sorted_comments[:5]
+    # Calculate engagement metrics and find the most engaging comments in one pass,
+    # keeping a min-heap of the top 5 (earlier comments win ties)
+    total_likes = 0
+    top_heap = []
+    for index, like_count in enumerate(likes):
+        total_likes += like_count
+        entry = (like_count, -index)
+        if len(top_heap) < 5:
+            heapq.heappush(top_heap, entry)
+        elif entry > top_heap[0]:
+            heapq.heapreplace(top_heap, entry)
+    avg_likes = total_likes / total_comments if total_comments else 0
+    top_comments = [comment_view(-entry[1]) for entry in sorted(top_heap, reverse=True)]
     
     # Generate insights
-    insights = generate_comment_insights(categorization, avg_likes, len(comments))
+    insights = generate_comment_insights(categorization, avg_likes, total_comments)
     
     return {
-        "total_comments": len(comments),
+        "total_comments": total_comments,
         "categories": categorization["categories"],
         "question_types": categorization["question_types"],
         "engagement_metrics": {
@@ -506,7 +881,7 @@ def analyze_comment_overview(comments):
         },
         "top_comments": top_comments,
         "insights": insights,
-        "categorized_comments": categorization["categorized_comments"][:20]  # First 20 for demo
+        "categorized_comments": [comment_view(i) for i in range(min(20, total_comments))]  # First 20 for demo
     }
 
 def generate_comment_insights(categorization, avg_likes, total_comments):
@@ -517,14 +892,14 @@ def generate_comment_insights(categorization, avg_likes, total_comments):
     question_types = categorization["question_types"]
     
     # Category insights
-    dominant_category = max(categories.items(), key=lambda x: x[1])
+    dominant_category = max(categories.items(), key=itemgetter(1))
     if dominant_category[1] > total_comments * 0.3:  # More than 30%
         insights.append(f"Comments are predominantly {dominant_category[0]} ({dominant_category[1]} comments)")
     
     # Question insights
-    total_questions = question_types["how_to"] + question_types["what_is"] + question_types["when_will"] + question_types["why"] + question_types["where"] + question_types["general"]
+    total_questions = sum(question_types.values())
     if total_questions > 0:
-        most_common_question = max(question_types.items(), key=lambda x: x[1])
+        most_common_question = max(question_types.items(), key=itemgetter(1))
         insights.append(f"Most common question type: {most_common_question[0]} ({most_common_question[1]} questions)")
     
     # Engagement insights
@@ -570,15 +945,17 @@ def analyze_video():
         if not video_id:
             return jsonify({"error": "Video ID required"}), 400
         
-        print(f"🎬 Analyzing video: {video_id}")
+        logger.info(f"🎬 Analyzing video: {video_id}")
         
-        # Get comprehensive video data
-        video_data = get_detailed_video_info(video_id)
+        # Fetch video data and comment analytics concurrently
+        f_video = _EXEC.submit(get_detailed_video_info, video_id)
+        f_comments = _EXEC.submit(get_comprehensive_comments, video_id)
+        
+        video_data = f_video.result()
         if not video_data or 'error' in video_data:
             return jsonify({"error": "Could not fetch video data"}), 400
         
-        # Get comment analytics
-        comment_data = get_comprehensive_comments(video_id)
+        comment_data = f_comments.result()
         
         # Calculate performance metrics
         performance_data = calculate_performance_metrics(video_data, comment_data)
@@ -603,8 +980,7 @@ def analyze_video():
 def get_metrics():
     """Get performance metrics summary"""
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
+        cursor = get_db().cursor()
         
         cursor.execute('''
             SELECT 
@@ -617,15 +993,14 @@ def get_metrics():
         ''')
         
         result = cursor.fetchone()
-        conn.close()
         
         if result:
             return jsonify({
-                "total_videos_analyzed": result[0],
-                "average_engagement_rate": round(result[1] or 0, 2),
-                "average_views": int(result[2] or 0),
-                "average_likes": int(result[3] or 0),
-                "total_views_analyzed": int(result[4] or 0)
+                "total_videos_analyzed": result["total_videos"],
+                "average_engagement_rate": round(result["avg_engagement"] or 0, 2),
+                "average_views": int(result["avg_views"] or 0),
+                "average_likes": int(result["avg_likes"] or 0),
+                "total_views_analyzed": int(result["total_views"] or 0)
             })
         else:
             return jsonify({"message": "No analytics data available"})
@@ -637,34 +1012,25 @@ def get_metrics():
 def get_history():
     """Get analysis history with details"""
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
+        cursor = get_db().cursor()
         
         cursor.execute('''
             SELECT 
-                v.video_id, v.title, v.view_count, v.like_count, v.engagement_rate,
-                c.sentiment_score, c.total_comments, v.analyzed_at
+                v.video_id AS video_id,
+                v.title AS title,
+                v.view_count AS views,
+                v.like_count AS likes,
+                v.engagement_rate AS engagement_rate,
+                c.sentiment_score AS sentiment_score,
+                c.total_comments AS total_comments,
+                v.analyzed_at AS analyzed_at
             FROM video_analytics v
             LEFT JOIN comment_analytics c ON v.video_id = c.video_id
             ORDER BY v.analyzed_at DESC
             LIMIT 10
         ''')
         
-        results = cursor.fetchall()
-        conn.close()
-        
-        history = []
-        for row in results:
-            history.append({
-                "video_id": row[0],
-                "title": row[1],
-                "views": row[2],
-                "likes": row[3],
-                "engagement_rate": row[4],
-                "sentiment_score": row[5],
-                "total_comments": row[6],
-                "analyzed_at": row[7]
-            })
+        history = [dict(row) for row in cursor.fetchall()]
         
         return jsonify({"history": history})
         
@@ -710,42 +1076,51 @@ def compare_channels():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@_ttl_cached(_CHANNEL_CACHE)
+def get_channel_item(channel_id):
+    """Get the raw channels.list item for a channel"""
+    channel_response = get_youtube().channels().list(
+        part="snippet,statistics,brandingSettings",
+        id=channel_id
+    ).execute()
+    
+    return channel_response['items'][0] if channel_response['items'] else None
+
+@_ttl_cached(_CHANNEL_ANALYTICS_CACHE)
 def get_channel_analytics(channel_id):
     """Get comprehensive channel analytics"""
     try:
-        # Get channel info
-        channel_response = youtube.channels().list(
-            part="snippet,statistics,brandingSettings",
-            id=channel_id
-        ).execute()
+        # Get channel info and recent videos concurrently
+        f_channel = _EXEC.submit(get_channel_item, channel_id)
+        f_videos = _EXEC.submit(
+            lambda: get_youtube().search().list(
+                part="id,snippet",
+                channelId=channel_id,
+                order="date",
+                type="video",
+                maxResults=50
+            ).execute()
+        )
         
-        if not channel_response['items']:
+        channel = f_channel.result()
+        if not channel:
             return {"error": "Channel not found"}
         
-        channel = channel_response['items'][0]
         snippet = channel['snippet']
         statistics = channel['statistics']
         
-        # Get recent videos for analysis
-        videos_response = youtube.search().list(
-            part="id,snippet",
-            channelId=channel_id,
-            order="date",
-            type="video",
-            maxResults=50
-        ).execute()
-        
+        videos_response = f_videos.result()
         video_ids = [item['id']['videoId'] for item in videos_response['items']]
         
-        # Get detailed video stats
+        # Get detailed video stats in a single batched request
         videos_analytics = []
-        total_views = 0
-        total_likes = 0
-        total_comments = 0
         
-        for video_id in video_ids[:20]:  # Analyze first 20 videos
-            video_stats = get_detailed_video_info(video_id)
-            if video_stats and 'error' not in video_stats:
+        video_ids = video_ids[:20]  # Analyze first 20 videos
+        videos_info = get_detailed_video_info_batch(video_ids)
+        
+        for video_id in video_ids:
+            video_stats = videos_info.get(video_id)
+            if video_stats:
                 views = int(video_stats.get('view_count', 0))
                 likes = int(video_stats.get('like_count', 0))
                 comments = int(video_stats.get('comment_count', 0))
@@ -760,18 +1135,25 @@ def get_channel_analytics(channel_id):
                     "engagement_rate": engagement_rate,
                     "published_at": video_stats.get('published_at', '')
                 })
-                total_views += views
-                total_likes += likes
-                total_comments += comments
+        
+        # Per-video counts as arrays for the aggregate metrics
+        video_total = len(videos_analytics)
+        views_arr = np.fromiter((v['views'] for v in videos_analytics), dtype=np.int64, count=video_total)
+        likes_arr = np.fromiter((v['likes'] for v in videos_analytics), dtype=np.int64, count=video_total)
+        comments_arr = np.fromiter((v['comments'] for v in videos_analytics), dtype=np.int64, count=video_total)
+        
+        total_views = int(views_arr.sum())
+        total_likes = int(likes_arr.sum())
+        total_comments = int(comments_arr.sum())
         
         # Calculate channel metrics
         subscriber_count = int(statistics.get('subscriberCount', 0))
         video_count = int(statistics.get('videoCount', 0))
         view_count = int(statistics.get('viewCount', 0))
         
-        avg_views_per_video = total_views / len(videos_analytics) if videos_analytics else 0
-        avg_likes_per_video = total_likes / len(videos_analytics) if videos_analytics else 0
-        avg_comments_per_video = total_comments / len(videos_analytics) if videos_analytics else 0
+        avg_views_per_video = float(views_arr.mean()) if video_total else 0
+        avg_likes_per_video = float(likes_arr.mean()) if video_total else 0
+        avg_comments_per_video = float(comments_arr.mean()) if video_total else 0
         
         # Engagement metrics
         total_engagement = total_likes + total_comments
@@ -823,33 +1205,42 @@ def analyze_channel_performance(videos_analytics):
     if not videos_analytics:
         return {"insights": ["No video data available"]}
     
+    # Insights only depend on each video's title, views and engagement rate,
+    # so unchanged video data is served from the cache
+    key = tuple((v['title'], v['views'], v['engagement_rate']) for v in videos_analytics)
+    return {"insights": list(_channel_performance_insights(key))}
+
+# Insight templates; the .50 precision truncates titles without slicing
+_TOP_VIEWED_FMT = "Most viewed video: '{title:.50}...' ({views:,} views)"
+_TOP_ENGAGED_FMT = "Highest engagement: '{title:.50}...' ({rate}% engagement)"
+
+@lru_cache(maxsize=512)
+def _channel_performance_insights(videos):
+    """Compute channel performance insights from (title, views, engagement_rate) tuples"""
     insights = []
     
-    # Sort videos by different metrics
-    by_views = sorted(videos_analytics, key=lambda x: x['views'], reverse=True)
-    by_engagement = sorted(videos_analytics, key=lambda x: x['engagement_rate'], reverse=True)
-    by_likes = sorted(videos_analytics, key=lambda x: x['likes'], reverse=True)
-    
-    # Top performing videos
-    top_viewed = by_views[0] if by_views else None
-    top_engaged = by_engagement[0] if by_engagement else None
+    # Per-video views and engagement as arrays for the vectorized reductions below
+    video_total = len(videos)
+    views = np.fromiter((v[1] for v in videos), dtype=np.int64, count=video_total)
+    engagement = np.fromiter((v[2] for v in videos), dtype=np.float64, count=video_total)
     
-    if top_viewed:
-        insights.append(f"Most viewed video: '{top_viewed['title'][:50]}...' ({top_viewed['views']:,} views)")
+    # Top performing videos (argmax picks the first on ties)
+    top_viewed_title, top_viewed_views, _ = videos[int(views.argmax())]
+    top_engaged_title, _, top_engaged_rate = videos[int(engagement.argmax())]
     
-    if top_engaged:
-        insights.append(f"Highest engagement: '{top_engaged['title'][:50]}...' ({top_engaged['engagement_rate']}% engagement)")
+    insights.append(_TOP_VIEWED_FMT.format(title=top_viewed_title, views=top_viewed_views))
+    insights.append(_TOP_ENGAGED_FMT.format(title=top_engaged_title, rate=top_engaged_rate))
     
     # Performance patterns
-    avg_engagement = sum(v['engagement_rate'] for v in videos_analytics) / len(videos_analytics)
+    avg_engagement = float(engagement.mean())
     if avg_engagement > 5:
         insights.append("High average engagement rate across videos")
     elif avg_engagement < 1:
         insights.append("Low average engagement rate - consider content strategy")
     
     # Consistency analysis
-    view_counts = [v['views'] for v in videos_analytics]
-    view_variance = max(view_counts) / min(view_counts) if min(view_counts) > 0 else 0
+    min_views = int(views.min())
+    view_variance = int(views.max()) / min_views if min_views > 0 else 0
     
     if view_variance > 10:
         insights.append("High view variance - content performance is inconsistent")
@@ -857,27 +1248,30 @@ def analyze_channel_performance(videos_analytics):
         insights.append("Consistent view performance across videos")
     
     # Growth indicators
-    recent_videos = videos_analytics[:5]
-    older_videos = videos_analytics[-5:] if len(videos_analytics) >= 10 else []
-    
-    if recent_videos and older_videos:
-        recent_avg_views = sum(v['views'] for v in recent_videos) / len(recent_videos)
-        older_avg_views = sum(v['views'] for v in older_videos) / len(older_videos)
+    if video_total >= 10:
+        recent_avg_views = float(views[:5].mean())
+        older_avg_views = float(views[-5:].mean())
         
         if recent_avg_views > older_avg_views * 1.5:
             insights.append("Growing channel: Recent videos perform significantly better")
         elif recent_avg_views < older_avg_views * 0.7:
             insights.append("Declining performance: Recent videos underperform compared to older content")
     
-    return {"insights": insights}
+    return tuple(insights)
 
 def get_channel_comparison(channel_ids):
     """Compare multiple channels"""
     comparison = {}
+    records = []
+    
+    # Fetch channels concurrently on a dedicated pool; get_channel_analytics itself
+    # waits on _EXEC tasks, so running it on _EXEC could exhaust the workers
+    results = list(_CHANNEL_EXEC.map(get_channel_analytics, channel_ids))
     
-    for channel_id in channel_ids:
-        channel_data = get_channel_analytics(channel_id)
+    for channel_id, channel_data in zip(channel_ids, results):
         if 'error' not in channel_data and isinstance(channel_data, dict):
+            records.append(channel_analytics_record(channel_id, channel_data))
+            
             channel_info = channel_data.get('channel_info', {})
             statistics = channel_data.get('statistics', {})
             metrics = channel_data.get('metrics', {})
@@ -890,57 +1284,158 @@ def get_channel_comparison(channel_ids):
                 "avg_views_per_video": metrics.get('avg_views_per_video', 0)
             }
     
+    # Store all compared channels in the background
+    queue_channel_analytics(records)
+    
     return comparison
 
+class ChannelRow(NamedTuple):
+    """One channel_analytics row, in column order"""
+    channel_id: str
+    title: str = ''
+    subscriber_count: int = 0
+    video_count: int = 0
+    view_count: int = 0
+    engagement_rate: float = 0
+    avg_views_per_video: float = 0
+
+def channel_analytics_record(channel_id, data):
+    """Build the channel_analytics row for a channel analytics result"""
+    # Missing fields fall back to defaults so one bad result can't fail a whole batch
+    statistics = data.get('statistics', {})
+    metrics = data.get('metrics', {})
+    return ChannelRow(
+        channel_id,
+        data.get('channel_info', {}).get('title', ''),
+        statistics.get('subscriber_count', 0),
+        statistics.get('video_count', 0),
+        statistics.get('view_count', 0),
+        metrics.get('channel_engagement_rate', 0),
+        metrics.get('avg_views_per_video', 0)
+    )
+
 def store_channel_analytics(channel_id, data):
-    """Store channel analytics in database"""
+    """Queue channel analytics for the background database writer"""
     try:
-        conn = sqlite3.connect('analytics.db')
-        cursor = conn.cursor()
-        
-        # Create channel analytics table if not exists
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS channel_analytics (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                channel_id TEXT,
-                title TEXT,
-                subscriber_count INTEGER,
-                video_count INTEGER,
-                view_count INTEGER,
-                engagement_rate REAL,
-                avg_views_per_video REAL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+        record = channel_analytics_record(channel_id, data)
+    except Exception as e:
+        logger.error(f"Error storing channel analytics: {e}")
+        return
+    queue_channel_analytics([record])
+
+# Channel analytics records waiting for the background writer
+_channel_write_queue = queue.Queue(maxsize=CHANNEL_WRITE_QUEUE_MAX)
+_channel_writer = None
+_channel_writer_lock = Lock()
+_CHANNEL_WRITER_STOP = object()
+
+def queue_channel_analytics(records):
+    """Hand channel analytics records to the background writer, starting it if needed"""
+    global _channel_writer
+    
+    if _channel_writer is None:
+        with _channel_writer_lock:
+            if _channel_writer is None:
+                _channel_writer = Thread(target=_channel_writer_loop, name="channel-analytics-writer", daemon=True)
+                _channel_writer.start()
+                atexit.register(_stop_channel_writer)
+    
+    # Never block a request on a backed-up writer; shed load instead
+    dropped = 0
+    for record in records:
+        try:
+            _channel_write_queue.put_nowait(record)
+        except queue.Full:
+            dropped += 1
+    if dropped:
+        logger.warning(f"Channel analytics write queue full; dropped {dropped} records")
+
+def _stop_channel_writer():
+    """Flush queued channel analytics and stop the writer at interpreter exit"""
+    _channel_write_queue.put(_CHANNEL_WRITER_STOP)  # Queued after every pending record
+    _channel_writer.join(timeout=10)
+
+def _channel_writer_loop():
+    """Drain queued channel analytics into the database in batches"""
+    # init_db only runs under __main__; under a bare `gunicorn analytics_api:app`
+    # this is the first thing to touch the channel database
+    try:
+        init_channel_db()
+    except sqlite3.Error as e:
+        logger.error(f"Error creating channel analytics schema: {e}")
+    
+    # The writer is the only channel DB writer, so it owns one connection; reopened after a failure
+    conn = None
+    stopping = False
+    while not stopping:
+        batch = []
+        item = _channel_write_queue.get()
+        deadline = time.monotonic() + CHANNEL_WRITE_INTERVAL
+        
+        # Keep collecting until the batch is full, the interval runs out or we're told to stop
+        while True:
+            if item is _CHANNEL_WRITER_STOP:
+                stopping = True
+                break
+            batch.append(item)
+            remaining = deadline - time.monotonic()
+            if len(batch) >= CHANNEL_WRITE_BATCH or remaining <= 0:
+                break
+            try:
+                item = _channel_write_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+        
+        # A failed batch is logged and dropped; the writer itself must keep running
+        try:
+            if batch:
+                if conn is None:
+                    conn = _open_channel_conn()
+                store_channel_analytics_bulk(conn, batch)
+        except Exception as e:
+            logger.error(f"Error storing channel analytics batch of {len(batch)}: {e}")
+            if conn is not None:
+                conn.close()
+                conn = None
+    
+    if conn is not None:
+        conn.close()
+
+def store_channel_analytics_bulk(conn, records):
+    """Store many channel analytics rows in one transaction"""
+    if not records:
+        return
+    
+    try:
+        conn.execute("BEGIN")
         
-        # Insert channel data
-        cursor.execute('''
-            INSERT INTO channel_analytics 
-            (channel_id, title, subscriber_count, video_count, view_count, engagement_rate, avg_views_per_video)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            channel_id,
-            data['channel_info']['title'],
-            data['statistics']['subscriber_count'],
-            data['statistics']['video_count'],
-            data['statistics']['view_count'],
-            data['metrics']['channel_engagement_rate'],
-            data['metrics']['avg_views_per_video']
-        ))
+        # One multi-row INSERT per chunk of records
+        for start in range(0, len(records), CHANNEL_INSERT_BATCH):
+            batch = records[start:start + CHANNEL_INSERT_BATCH]
+            sql = _INSERT_CHANNEL_SQL_PREFIX + ", ".join([_CHANNEL_ROW_PLACEHOLDERS] * len(batch))
+            conn.execute(sql, [value for record in batch for value in record])
         
         conn.commit()
-        conn.close()
-        
-    except Exception as e:
-        print(f"Error storing channel analytics: {e}")
+    except Exception:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
 
 if __name__ == '__main__':
-    print("📊 Starting Comprehensive YouTube Analytics API")
-    print(f"🤖 Using Ollama model: {OLLAMA_MODEL}")
-    print("📈 Features: Video metrics, engagement analytics, comment analysis, performance tracking")
-    print("🌐 Server: http://localhost:8000")
+    logger.info("📊 Starting Comprehensive YouTube Analytics API")
+    logger.info(f"🤖 Using Ollama model: {OLLAMA_MODEL}")
+    logger.info("📈 Features: Video metrics, engagement analytics, comment analysis, performance tracking")
+    logger.info("🌐 Server: http://localhost:8000")
     
     # Initialize database
     init_db()
     
-    app.run(host='0.0.0.0', port=8000, debug=True) 
\ No newline at end of file
+    if '--dev' in sys.argv:
+        # Flask development server with the reloader and debugger
+        app.run(host='0.0.0.0', port=8000, debug=True)
+    else:
+        # Production: 4 gevent workers so YouTube/Ollama I/O doesn't serialize requests.
+        # execvp replaces the process without running atexit, so flush the log queue first;
+        # each worker sets up its own listener when it imports this module
+        stop_logging()
+        os.execvp("gunicorn", ["gunicorn", "-w", "4", "-k", "gevent", "-b", "0.0.0.0:8000", "analytics_api:app"]) 
\ No newline at end of file
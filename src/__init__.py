@@ -0,0 +1 @@
+# YouTube Analytics AI System
@@ -3,14 +3,73 @@ Analytics Agent for YouTube Video Analysis
 """
 
 from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from collections import Counter
+import heapq
+import numpy as np
 import pandas as pd
-from textblob import TextBlob
+from textblob.en.sentiments import PatternAnalyzer
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 from src.agents.base_agent import BaseAgent
-import importlib
-import src.services.youtube_service
-import src.services.enhanced_insights_service
+from src.services.youtube_service import EnhancedYouTubeService
+from src.services.enhanced_insights_service import EnhancedInsightsService
 import concurrent.futures
+import re
+import atexit
+import time
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Sentence terminators; a regex pass instead of TextBlob's sentence parser
+_SENTENCE_END_RE = re.compile(r'[.!?]+(?:\s|$)')
+_WORD_RE = re.compile(r'\S+')
+
+# Topic words for content gap analysis: 3+ letters/digits, no punctuation
+_TOPIC_TOKEN_RE = re.compile(r"[a-z0-9']{3,}")
+
+# Shared VADER analyzer; its lexicon is loaded once per process
+_vader_analyzer = SentimentIntensityAnalyzer()
+
+# VADER 3.3.x rewrites each emoji into its description with string
+# concatenation, which degrades badly on long or emoji-flooded comments
+_VADER_EMOJIS = frozenset(getattr(_vader_analyzer, 'emojis', {}))
+_VADER_MAX_CHARS = 2000
+_VADER_MAX_EMOJIS = 50
+_VADER_TRUNCATE_TO = 500
+
+@lru_cache(maxsize=10_000)
+def _vader(text: str) -> Dict[str, float]:
+    """VADER polarity scores, cached by text (comment streams repeat a lot)"""
+    if len(text) > _VADER_MAX_CHARS or sum(ch in _VADER_EMOJIS for ch in text) > _VADER_MAX_EMOJIS:
+        logger.warning(f"Truncating pathological comment for VADER ({len(text)} chars)")
+        text = text[:_VADER_TRUNCATE_TO]
+    return _vader_analyzer.polarity_scores(text)
+
+# TextBlob's default sentiment analyzer, without building a TextBlob per text
+_pattern_analyzer = PatternAnalyzer()
+
+@lru_cache(maxsize=10_000)
+def _textblob_polarity(text: str) -> float:
+    """TextBlob polarity, cached by text"""
+    try:
+        return float(_pattern_analyzer.analyze(text)[0])
+    except:
+        return 0.0
+
+# Comments shorter than this (empty, "👍", "ok") are scored neutral/other without analysis
+_MIN_COMMENT_LENGTH = 3
+_TRIVIAL_VADER = {"neg": 0.0, "neu": 1.0, "pos": 0.0, "compound": 0.0}
+_TRIVIAL_AI_SENTIMENT = {"sentiment": "neutral", "confidence": 1.0, "reasoning": "Trivial comment"}
+_TRIVIAL_AI_CATEGORY = {"category": "other", "confidence": 1.0, "reasoning": "Trivial comment"}
+
+# Circuit breaker for the batched AI comment calls
+_AI_BATCH_TIMEOUT = 30  # seconds to wait once local scoring is done
+_AI_FAILURE_LIMIT = 3  # consecutive failed analyses before AI is skipped
+_AI_COOLDOWN = 60  # seconds to skip AI after tripping
+_AI_UNAVAILABLE_SENTIMENT = {"sentiment": "neutral", "confidence": 0.0, "reasoning": "AI unavailable"}
+_AI_UNAVAILABLE_CATEGORY = {"category": "other", "confidence": 0.0, "reasoning": "AI unavailable"}
 
 class AnalyticsAgent(BaseAgent):
     """Agent for analyzing YouTube video analytics and comments"""
@@ -18,37 +77,37 @@ class AnalyticsAgent(BaseAgent):
     def __init__(self, api_key: str, model_name: Optional[str] = None):
         super().__init__(model_name)
         
-        # Force reload the module to ensure we get the latest version
-        importlib.reload(src.services.youtube_service)
-        importlib.reload(src.services.enhanced_insights_service)
-        from src.services.youtube_service import EnhancedYouTubeService
-        from src.services.enhanced_insights_service import EnhancedInsightsService
-        
         self.youtube_service = EnhancedYouTubeService(api_key)
         self.enhanced_insights = EnhancedInsightsService()
-        self.vader_analyzer = SentimentIntensityAnalyzer()
-        
-        # Workaround: Add missing methods to youtube_service if they don't exist
-        if not hasattr(self.youtube_service, 'get_video_comments'):
-            print("DEBUG: Adding get_video_comments method")
-            self.youtube_service.get_video_comments = self.youtube_service.get_comments
-        if not hasattr(self.youtube_service, 'get_video_transcript'):
-            print("DEBUG: Adding get_video_transcript method")
-            self.youtube_service.get_video_transcript = self.youtube_service.get_transcript
+        self.vader_analyzer = _vader_analyzer
+        
+        # Long-lived pool for get_with_timeout instead of a new executor per call
+        self._timeout_pool = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix='analytics-timeout')
+        atexit.register(self._timeout_pool.shutdown, wait=False)
+        
+        # Long-lived pool for YouTube fan-outs; its threads keep their thread-local
+        # API clients, so keep-alive connections survive across requests.
+        # Tasks submitted here must not wait on this pool themselves.
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=16, thread_name_prefix='analytics-io')
+        atexit.register(self._io_pool.shutdown, wait=False)
+        
+        # AI circuit breaker state
+        self._ai_fail_count = 0
+        self._ai_skip_until = 0.0
+        self._ai_lock = threading.Lock()  # Agents are shared across concurrent requests
     
     def get_with_timeout(self, func, *args, timeout=20, **kwargs):
         """Execute a function with a timeout using ThreadPoolExecutor"""
         try:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(func, *args, **kwargs)
-                try:
-                    return future.result(timeout=timeout)
-                except concurrent.futures.TimeoutError:
-                    # Cancel the future if it's still running
-                    future.cancel()
-                    return {"error": f"Operation exceeded {timeout} seconds."}
-                except Exception as e:
-                    return {"error": f"Operation failed: {str(e)}"}
+            future = self._timeout_pool.submit(func, *args, **kwargs)
+            try:
+                return future.result(timeout=timeout)
+            except concurrent.futures.TimeoutError:
+                # Cancel the future if it's still running
+                future.cancel()
+                return {"error": f"Operation exceeded {timeout} seconds."}
+            except Exception as e:
+                return {"error": f"Operation failed: {str(e)}"}
         except Exception as e:
             return {"error": f"Thread pool error: {str(e)}"}
     
@@ -73,11 +132,8 @@ class AnalyticsAgent(BaseAgent):
             if not comments:
                 return {"error": "No comments found"}
             # Simple sentiment breakdown
-            sentiment_counts = {"positive": 0, "negative": 0, "neutral": 0}
-            for c in comments:
-                sentiment = c.get("sentiment", "neutral")
-                if sentiment in sentiment_counts:
-                    sentiment_counts[sentiment] += 1
+            counts = Counter(c.get("sentiment", "neutral") for c in comments)
+            sentiment_counts = {sentiment: counts[sentiment] for sentiment in ("positive", "negative", "neutral")}
             return {
                 "total_comments": len(comments),
                 "sentiment_breakdown": sentiment_counts,
@@ -86,8 +142,13 @@ class AnalyticsAgent(BaseAgent):
         except Exception as e:
             return {"error": str(e)}
     
-    def analyze_comments(self, comments: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Analyze comments using multiple sentiment analysis methods"""
+    def analyze_comments(self, comments: List[Dict[str, Any]], compute_textblob: bool = False) -> Dict[str, Any]:
+        """Analyze comments using multiple sentiment analysis methods
+        
+        TextBlob polarity is informational only (VADER drives the breakdown),
+        so it is computed only when compute_textblob is set. Per-comment
+        results in "ai_analysis" are columnar: one list per field, in comment order.
+        """
         if not comments or not isinstance(comments, list):
             return {"error": "No comments found or invalid comment data"}
         
@@ -95,7 +156,7 @@ class AnalyticsAgent(BaseAgent):
             "total_comments": len(comments),
             "sentiment_breakdown": {"positive": 0, "negative": 0, "neutral": 0},
             "categories": {},
-            "ai_analysis": [],
+            "ai_analysis": {},
             "engagement_metrics": {
                 "total_likes": 0,
                 "total_replies": 0,
@@ -103,82 +164,118 @@ class AnalyticsAgent(BaseAgent):
             }
         }
         
-        total_likes = 0
-        total_replies = 0
+        # Empty and emoji-only comments skip every analyzer and stay neutral/other
+        texts = [comment.get('comment', '') for comment in comments]
+        scored = [i for i, text in enumerate(texts) if len(text.strip()) >= _MIN_COMMENT_LENGTH]
+        scored_texts = [texts[i] for i in scored]
+        trivial_textblob = 0.0 if compute_textblob else None
+        local_scores = [(_TRIVIAL_VADER, trivial_textblob)] * len(texts)
+        ai_sentiments = [_TRIVIAL_AI_SENTIMENT] * len(texts)
+        ai_categories = [_TRIVIAL_AI_CATEGORY] * len(texts)
         
-        for comment in comments:
-            text = comment.get('comment', '')
-            likes = comment.get('likes', 0)
-            replies = comment.get('reply_count', 0)
-            
-            total_likes += likes
-            total_replies += replies
-            
-            # VADER sentiment analysis
-            vader_scores = self.vader_analyzer.polarity_scores(text)
-            
-            # TextBlob sentiment analysis
-            try:
-                blob = TextBlob(text)
-                textblob_sentiment = float(blob.sentiment.polarity)
-            except:
-                textblob_sentiment = 0.0
-            
-            # AI sentiment analysis
-            ai_sentiment = self.ai_service.analyze_sentiment(text)
-            
-            # AI categorization
-            ai_category = self.ai_service.categorize_comment(text)
-            
-            # Determine overall sentiment
-            if vader_scores['compound'] > 0.05:
-                sentiment = "positive"
-            elif vader_scores['compound'] < -0.05:
-                sentiment = "negative"
-            else:
-                sentiment = "neutral"
-            
-            results["sentiment_breakdown"][sentiment] += 1
-            
-            # Track categories
-            category = ai_category.get('category', 'other')
-            if category not in results["categories"]:
-                results["categories"][category] = 0
-            results["categories"][category] += 1
-            
-            # Store AI analysis
-            results["ai_analysis"].append({
-                "comment_id": comment.get('id'),
-                "text": text,
-                "vader_scores": vader_scores,
-                "textblob_sentiment": textblob_sentiment,
-                "ai_sentiment": ai_sentiment,
-                "ai_category": ai_category,
-                "likes": likes,
-                "replies": replies
-            })
+        # Batched AI sentiment and categorization run concurrently while
+        # VADER (and optionally TextBlob) score each comment locally
+        if scored_texts:
+            ai_futures = None
+            with self._ai_lock:
+                ai_available = time.monotonic() >= self._ai_skip_until
+            if ai_available:
+                ai_futures = [
+                    self._timeout_pool.submit(self.ai_service.analyze_sentiment_batch, scored_texts),
+                    self._timeout_pool.submit(self.ai_service.categorize_comment_batch, scored_texts)
+                ]
+            for i, text in zip(scored, scored_texts):
+                local_scores[i] = self._score_comment(text, compute_textblob)
+            scored_sentiments, scored_categories = self._collect_ai_results(ai_futures, len(scored_texts))
+            for i, ai_sentiment, ai_category in zip(scored, scored_sentiments, scored_categories):
+                ai_sentiments[i] = ai_sentiment
+                ai_categories[i] = ai_category
+        
+        # Per-comment numbers as arrays for the vectorized aggregates
+        total = len(comments)
+        likes = np.fromiter((c.get('likes', 0) for c in comments), dtype=np.int64, count=total)
+        replies = np.fromiter((c.get('reply_count', 0) for c in comments), dtype=np.int64, count=total)
+        compound = np.fromiter((scores[0]['compound'] for scores in local_scores), dtype=np.float64, count=total)
+        
+        # Overall sentiment from the VADER compound score
+        positive = int(np.count_nonzero(compound > 0.05))
+        negative = int(np.count_nonzero(compound < -0.05))
+        results["sentiment_breakdown"] = {"positive": positive, "negative": negative, "neutral": total - positive - negative}
+        
+        # Track categories
+        results["categories"] = dict(Counter(ai_category.get('category', 'other') for ai_category in ai_categories))
+        
+        # Store AI analysis as columns rather than one nested dict per comment
+        results["ai_analysis"] = {
+            "comment_id": [comment.get('id') for comment in comments],
+            "text": texts,
+            "vader_positive": [scores[0]['pos'] for scores in local_scores],
+            "vader_negative": [scores[0]['neg'] for scores in local_scores],
+            "vader_neutral": [scores[0]['neu'] for scores in local_scores],
+            "vader_compound": compound.tolist(),
+            "textblob_sentiment": [scores[1] for scores in local_scores],
+            "ai_sentiment": [s.get('sentiment', 'neutral') for s in ai_sentiments],
+            "ai_sentiment_confidence": [s.get('confidence', 0.5) for s in ai_sentiments],
+            "ai_category": [c.get('category', 'other') for c in ai_categories],
+            "ai_category_confidence": [c.get('confidence', 0.5) for c in ai_categories],
+            "likes": likes.tolist(),
+            "replies": replies.tolist()
+        }
         
         # Calculate engagement metrics
+        total_likes = int(likes.sum())
         results["engagement_metrics"]["total_likes"] = total_likes
-        results["engagement_metrics"]["total_replies"] = total_replies
-        results["engagement_metrics"]["avg_likes_per_comment"] = total_likes / len(comments) if comments else 0
+        results["engagement_metrics"]["total_replies"] = int(replies.sum())
+        results["engagement_metrics"]["avg_likes_per_comment"] = total_likes / total
         
         return results
     
+    def _collect_ai_results(self, ai_futures: Optional[List[concurrent.futures.Future]], count: int) -> tuple:
+        """Wait (bounded) for the AI batch futures; failures fall back and feed the circuit breaker"""
+        fallbacks = ([_AI_UNAVAILABLE_SENTIMENT] * count, [_AI_UNAVAILABLE_CATEGORY] * count)
+        if ai_futures is None:
+            return fallbacks
+        
+        concurrent.futures.wait(ai_futures, timeout=_AI_BATCH_TIMEOUT)
+        results = []
+        failed = False
+        for future, fallback in zip(ai_futures, fallbacks):
+            # Slow calls are abandoned; AIBatchError means the backend returned nothing usable
+            if future.done() and future.exception() is None:
+                results.append(future.result())
+            else:
+                future.cancel()
+                failed = True
+                results.append(fallback)
+        
+        with self._ai_lock:
+            if not failed:
+                self._ai_fail_count = 0
+            else:
+                self._ai_fail_count += 1
+                if self._ai_fail_count >= _AI_FAILURE_LIMIT:
+                    self._ai_skip_until = time.monotonic() + _AI_COOLDOWN
+                    self.logger.warning(f"AI analysis failed {self._ai_fail_count} times in a row; skipping it for {_AI_COOLDOWN}s")
+        return tuple(results)
+    
+    def _score_comment(self, text: str, compute_textblob: bool = False) -> tuple:
+        """Score one comment with VADER and, if requested, TextBlob"""
+        # VADER sentiment analysis
+        vader_scores = _vader(text)
+        
+        # TextBlob sentiment analysis
+        textblob_sentiment = _textblob_polarity(text) if compute_textblob else None
+        
+        return vader_scores, textblob_sentiment
+    
     def analyze_transcript(self, transcript: str) -> Dict[str, Any]:
         """Analyze video transcript"""
         if not transcript:
             return {"error": "No transcript found"}
         
-        # Basic text analysis
-        try:
-            blob = TextBlob(transcript)
-            sentences = list(blob.sentences)
-            sentence_count = len(sentences)
-        except:
-            # Fallback to simple sentence counting
-            sentences = transcript.split('.')
-            sentence_count = len([s for s in sentences if s.strip()])
+        # Basic text analysis; count matches without materializing token lists
+        word_count = sum(1 for _ in _WORD_RE.finditer(transcript))
+        sentence_count = sum(1 for _ in _SENTENCE_END_RE.finditer(transcript)) or 1
         
         # AI analysis of transcript
         ai_analysis = self.ai_service.generate_content(
@@ -191,8 +288,6 @@ class AnalyticsAgent(BaseAgent):
             "transcript analysis"
         )
         
-        word_count = len(transcript.split())
-        
         return {
             "word_count": word_count,
             "sentence_count": sentence_count,
@@ -214,47 +309,33 @@ class AnalyticsAgent(BaseAgent):
     def get_channel_analytics(self, channel_id: str) -> Dict[str, Any]:
         """Get comprehensive channel analytics"""
         try:
-            # Get channel info
-            channel_info = self.youtube_service.get_channel_info(channel_id)
+            channel_info, video_ids, video_stats_list = self._fetch_channel_data(channel_id)
             if not channel_info:
                 return {"error": "Channel not found"}
             
-            # Get recent videos for analysis
-            recent_videos = self.youtube_service.get_channel_videos(channel_id, max_results=20)
-            
             # Analyze recent videos
-            videos_analytics = []
-            total_views = 0
-            total_likes = 0
-            total_comments = 0
-            
-            for video in recent_videos:
-                video_id = video.get('id', {}).get('videoId')
-                if video_id:
-                    video_stats = self.youtube_service.get_video_info(video_id)
-                    if video_stats:
-                        views = video_stats.get('view_count', 0)
-                        likes = video_stats.get('like_count', 0)
-                        comments = video_stats.get('comment_count', 0)
-                        
-                        videos_analytics.append({
-                            "video_id": video_id,
-                            "title": video_stats.get('title', ''),
-                            "views": views,
-                            "likes": likes,
-                            "comments": comments,
-                            "engagement_rate": video_stats.get('engagement_rate', 0),
-                            "published_at": video_stats.get('published_at', '')
-                        })
-                        
-                        total_views += views
-                        total_likes += likes
-                        total_comments += comments
+            videos_analytics = [
+                {
+                    "video_id": video_id,
+                    "title": video_stats.get('title', ''),
+                    "views": video_stats.get('view_count', 0),
+                    "likes": video_stats.get('like_count', 0),
+                    "comments": video_stats.get('comment_count', 0),
+                    "engagement_rate": video_stats.get('engagement_rate', 0),
+                    "published_at": video_stats.get('published_at', '')
+                }
+                for video_id, video_stats in zip(video_ids, video_stats_list)
+                if video_stats
+            ]
+            
+            # Totals and per-video averages from one (videos x [views, likes, comments]) array
+            counts = np.array([[v['views'], v['likes'], v['comments']] for v in videos_analytics], dtype=np.int64).reshape(-1, 3)
+            total_views, total_likes, total_comments = (int(total) for total in counts.sum(axis=0))
             
             # Calculate metrics
-            avg_views_per_video = total_views / len(videos_analytics) if videos_analytics else 0
-            avg_likes_per_video = total_likes / len(videos_analytics) if videos_analytics else 0
-            avg_comments_per_video = total_comments / len(videos_analytics) if videos_analytics else 0
+            avg_views_per_video, avg_likes_per_video, avg_comments_per_video = (
+                (float(avg) for avg in counts.mean(axis=0)) if videos_analytics else (0, 0, 0)
+            )
             
             # Engagement metrics
             total_engagement = total_likes + total_comments
@@ -295,13 +376,14 @@ class AnalyticsAgent(BaseAgent):
         
         insights = []
         
-        # Sort videos by different metrics
-        by_views = sorted(videos_analytics, key=lambda x: x.get('views', 0), reverse=True)
-        by_engagement = sorted(videos_analytics, key=lambda x: x.get('engagement_rate', 0), reverse=True)
+        # Per-video views and engagement as arrays for the vectorized reductions below
+        total = len(videos_analytics)
+        views = np.fromiter((v.get('views', 0) for v in videos_analytics), dtype=np.int64, count=total)
+        engagement = np.fromiter((v.get('engagement_rate', 0) for v in videos_analytics), dtype=np.float64, count=total)
         
-        # Top performing videos
-        top_viewed = by_views[0] if by_views else None
-        top_engaged = by_engagement[0] if by_engagement else None
+        # Top performing videos (argmax picks the first on ties)
+        top_viewed = videos_analytics[int(views.argmax())]
+        top_engaged = videos_analytics[int(engagement.argmax())]
         
         if top_viewed:
             insights.append(f"Most viewed video: '{top_viewed.get('title', '')[:50]}...' ({top_viewed.get('views', 0):,} views)")
@@ -310,16 +392,16 @@ class AnalyticsAgent(BaseAgent):
             insights.append(f"Highest engagement: '{top_engaged.get('title', '')[:50]}...' ({top_engaged.get('engagement_rate', 0)}% engagement)")
         
         # Performance patterns
-        avg_engagement = sum(v.get('engagement_rate', 0) for v in videos_analytics) / len(videos_analytics)
+        avg_engagement = float(engagement.mean())
         if avg_engagement > 5:
             insights.append("High average engagement rate across videos")
         elif avg_engagement < 1:
             insights.append("Low average engagement rate - consider content strategy")
         
         # Consistency analysis
-        view_counts = [v.get('views', 0) for v in videos_analytics]
-        if view_counts and min(view_counts) > 0:
-            view_variance = max(view_counts) / min(view_counts)
+        min_views = int(views.min())
+        if min_views > 0:
+            view_variance = int(views.max()) / min_views
             if view_variance > 10:
                 insights.append("High view variance - content performance is inconsistent")
             else:
@@ -327,12 +409,32 @@ class AnalyticsAgent(BaseAgent):
         
         return {"insights": insights}
 
+    def _fetch_channel_data(self, channel_id: str) -> tuple:
+        """Fetch channel info, recent video IDs and their stats"""
+        # Channel info alongside the search-based recent video listing. This runs
+        # inside _io_pool tasks, so the side call goes to the (leaf-only) timeout pool.
+        channel_future = self._timeout_pool.submit(self.youtube_service.get_channel_info, channel_id)
+        recent_videos = self.youtube_service.get_channel_videos(channel_id, 20)
+        channel_info = channel_future.result()
+        if not channel_info:
+            return None, [], []
+        
+        # Video stats in one batched videos.list call, in the channel's video order
+        video_ids = [video.get('id', {}).get('videoId') for video in recent_videos]
+        video_ids = [video_id for video_id in video_ids if video_id]
+        stats_map = self.youtube_service.get_videos_info(video_ids)
+        return channel_info, video_ids, [stats_map.get(video_id) for video_id in video_ids]
+    
     def compare_channels(self, channel_ids: List[str]) -> Dict[str, Any]:
         """Compare multiple channels"""
         comparison = {}
+        if not channel_ids:
+            return comparison
+        
+        # Fetch channel analytics concurrently; map keeps input order
+        results = list(self._io_pool.map(self.get_channel_analytics, channel_ids))
         
-        for channel_id in channel_ids:
-            channel_data = self.get_channel_analytics(channel_id)
+        for channel_id, channel_data in zip(channel_ids, results):
             if 'error' not in channel_data:
                 comparison[channel_id] = {
                     "title": channel_data.get('channel_info', {}).get('title', ''),
@@ -447,46 +549,13 @@ class AnalyticsAgent(BaseAgent):
             # Search for videos
             videos = self.youtube_service.search_videos_by_keywords(keywords, max_results)
             
-            # Analyze each video for sponsorships
+            # Warm the video info cache with one batched videos.list call
+            self.youtube_service.get_videos_info([video['id'] for video in videos])
+            
+            # Analyze videos concurrently; each one is several network round trips
             analyzed_videos = []
-            for video in videos:
-                video_id = video['id']
-                
-                # Get detailed video info
-                video_details = self.youtube_service.get_video_info(video_id)
-                if not video_details:
-                    continue
-                
-                # Get transcript
-                transcript = self.youtube_service.get_transcript(video_id)
-                
-                # Detect sponsorships
-                sponsorship_analysis = self.youtube_service.detect_sponsorships(
-                    transcript or "",
-                    video_details.get('title', ""),
-                    video_details.get('description', "")
-                )
-                
-                # Calculate engagement metrics
-                view_count = video_details.get('view_count', 0)
-                like_count = video_details.get('like_count', 0)
-                comment_count = video_details.get('comment_count', 0)
-                engagement_rate = ((like_count + comment_count) / view_count * 100) if view_count > 0 else 0
-                
-                analyzed_video = {
-                    "video_id": video_id,
-                    "title": video_details.get('title', ''),
-                    "channel": video_details.get('channel', ''),
-                    "published_at": video_details.get('published_at', ''),
-                    "view_count": view_count,
-                    "like_count": like_count,
-                    "comment_count": comment_count,
-                    "engagement_rate": round(engagement_rate, 2),
-                    "sponsorship_analysis": sponsorship_analysis,
-                    "thumbnail": video_details.get('thumbnail', '')
-                }
-                
-                analyzed_videos.append(analyzed_video)
+            if videos:
+                analyzed_videos = [v for v in self._io_pool.map(self._analyze_video_sponsorship, videos) if v]
             
             # Generate sponsorship summary
             sponsorship_summary = self.youtube_service.generate_sponsorship_summary(analyzed_videos)
@@ -501,44 +570,83 @@ class AnalyticsAgent(BaseAgent):
         except Exception as e:
             return {"error": str(e)}
 
+    def _analyze_video_sponsorship(self, video: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Fetch details and transcript for one search result and detect its sponsorships"""
+        video_id = video['id']
+        
+        # Get detailed video info
+        video_details = self.youtube_service.get_video_info(video_id)
+        if not video_details:
+            return None
+        
+        # Get transcript
+        transcript = self.youtube_service.get_transcript(video_id)
+        
+        # Detect sponsorships
+        sponsorship_analysis = self.youtube_service.detect_sponsorships(
+            transcript or "",
+            video_details.get('title', ""),
+            video_details.get('description', "")
+        )
+        
+        # Calculate engagement metrics
+        view_count = video_details.get('view_count', 0)
+        like_count = video_details.get('like_count', 0)
+        comment_count = video_details.get('comment_count', 0)
+        engagement_rate = ((like_count + comment_count) / view_count * 100) if view_count > 0 else 0
+        
+        return {
+            "video_id": video_id,
+            "title": video_details.get('title', ''),
+            "channel": video_details.get('channel', ''),
+            "published_at": video_details.get('published_at', ''),
+            "view_count": view_count,
+            "like_count": like_count,
+            "comment_count": comment_count,
+            "engagement_rate": round(engagement_rate, 2),
+            "sponsorship_analysis": sponsorship_analysis,
+            "thumbnail": video_details.get('thumbnail', '')
+        }
+
     def get_enhanced_insights(self, video_id: str) -> Dict[str, Any]:
         """Get enhanced insights using the new insights service"""
         try:
-            # Get basic video data
-            video_info = self.youtube_service.get_video_info(video_id)
+            # Get basic video data and comments for analysis concurrently
+            video_info_future = self._io_pool.submit(self.youtube_service.get_video_info, video_id)
+            comments_future = self._io_pool.submit(self.youtube_service.get_comments, video_id, max_results=100)
+            video_info = video_info_future.result()
+            comments = comments_future.result()
             if not video_info:
                 return {"error": "Could not fetch video info"}
             
-            # Get comments for analysis
-            comments = self.youtube_service.get_comments(video_id, max_results=100)
+            # Local analyses overlap the AI calls; AI insights wait only on the performance score
+            with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+                # Content performance prediction
+                performance_future = executor.submit(self.enhanced_insights.analyze_content_performance_potential, video_info)
+                
+                # Audience behavior patterns
+                audience_future = executor.submit(self.enhanced_insights.analyze_audience_behavior_patterns, comments) if comments else None
+                
+                # Content optimization suggestions
+                optimization_future = executor.submit(self.enhanced_insights.generate_content_optimization_suggestions, video_info, comments or [])
+                
+                # AI-generated insights
+                ai_insights_future = executor.submit(lambda: self.ai_service.generate_insights({
+                    "video_info": video_info,
+                    "comments_count": len(comments) if comments else 0,
+                    "performance_score": performance_future.result().get("performance_score", 0)
+                }, "comprehensive video analytics"))
+                
+                # Performance prediction
+                prediction_future = executor.submit(self.ai_service.predict_performance, video_info)
             
             # Generate enhanced insights
-            enhanced_results = {}
-            
-            # Content performance prediction
-            performance_analysis = self.enhanced_insights.analyze_content_performance_potential(video_info)
-            enhanced_results["performance_prediction"] = performance_analysis
-            
-            # Audience behavior patterns
-            if comments:
-                audience_analysis = self.enhanced_insights.analyze_audience_behavior_patterns(comments)
-                enhanced_results["audience_behavior"] = audience_analysis
-            
-            # Content optimization suggestions
-            optimization_suggestions = self.enhanced_insights.generate_content_optimization_suggestions(video_info, comments or [])
-            enhanced_results["optimization_suggestions"] = optimization_suggestions
-            
-            # AI-generated insights
-            ai_insights = self.ai_service.generate_insights({
-                "video_info": video_info,
-                "comments_count": len(comments) if comments else 0,
-                "performance_score": performance_analysis.get("performance_score", 0)
-            }, "comprehensive video analytics")
-            enhanced_results["ai_insights"] = ai_insights
-            
-            # Performance prediction
-            performance_prediction = self.ai_service.predict_performance(video_info)
-            enhanced_results["performance_prediction"]["ai_prediction"] = performance_prediction
+            enhanced_results = {"performance_prediction": performance_future.result()}
+            if audience_future:
+                enhanced_results["audience_behavior"] = audience_future.result()
+            enhanced_results["optimization_suggestions"] = optimization_future.result()
+            enhanced_results["ai_insights"] = ai_insights_future.result()
+            enhanced_results["performance_prediction"]["ai_prediction"] = prediction_future.result()
             
             return enhanced_results
             
@@ -548,47 +656,38 @@ class AnalyticsAgent(BaseAgent):
     def get_content_gap_analysis(self, channel_id: str, niche_keywords: List[str]) -> Dict[str, Any]:
         """Analyze content gaps in the niche"""
         try:
-            # Get channel videos
-            channel_videos = self.youtube_service.get_channel_videos(channel_id, max_results=50)
-            
-            # Search for videos in the niche
-            niche_videos = []
-            for keyword in niche_keywords[:3]:  # Limit to top 3 keywords
-                search_results = self.youtube_service.search_videos_by_keywords(keyword, max_results=20)
-                niche_videos.extend(search_results)
-            
-            # Analyze gaps
-            channel_topics = set()
-            niche_topics = set()
-            
-            # Extract topics from channel videos
-            for video in channel_videos:
-                title = video.get('snippet', {}).get('title', '').lower()
-                description = video.get('snippet', {}).get('description', '').lower()
-                channel_topics.update(title.split() + description.split())
-            
-            # Extract topics from niche videos
-            for video in niche_videos:
-                title = video.get('snippet', {}).get('title', '').lower()
-                description = video.get('snippet', {}).get('description', '').lower()
-                niche_topics.update(title.split() + description.split())
-            
-            # Find gaps
-            content_gaps = niche_topics - channel_topics
+            # Get channel videos and search the niche (top 3 keywords) concurrently
+            keywords = niche_keywords[:3]
+            channel_future = self._io_pool.submit(self.youtube_service.get_channel_videos, channel_id, 50)
+            search_results = self._io_pool.map(
+                lambda keyword: self.youtube_service.search_videos_by_keywords(keyword, max_results=20), keywords
+            )
+            niche_videos = [video for results in search_results for video in results]
+            channel_videos = channel_future.result()
+            
+            # Analyze gaps: topic word frequencies, stopwords excluded
+            channel_topics = self._topic_counts(channel_videos)
+            niche_topics = self._topic_counts(niche_videos)
+            
+            # Find gaps, most frequent in the niche first
+            content_gaps = {topic: count for topic, count in niche_topics.items() if topic not in channel_topics}
+            top_gaps = heapq.nlargest(20, content_gaps, key=content_gaps.get)
+            top_channel_topics = [topic for topic, _ in channel_topics.most_common(20)]
+            top_niche_topics = [topic for topic, _ in niche_topics.most_common(20)]
             
             # Generate AI insights on gaps
             gap_analysis = self.ai_service.generate_insights({
-                "channel_topics": list(channel_topics)[:20],
-                "niche_topics": list(niche_topics)[:20],
-                "content_gaps": list(content_gaps)[:20],
+                "channel_topics": top_channel_topics,
+                "niche_topics": top_niche_topics,
+                "content_gaps": top_gaps,
                 "channel_videos_count": len(channel_videos),
                 "niche_videos_count": len(niche_videos)
             }, "content gap analysis")
             
             return {
-                "channel_topics": list(channel_topics)[:20],
-                "niche_topics": list(niche_topics)[:20],
-                "content_gaps": list(content_gaps)[:20],
+                "channel_topics": top_channel_topics,
+                "niche_topics": top_niche_topics,
+                "content_gaps": top_gaps,
                 "gap_analysis": gap_analysis,
                 "opportunity_score": len(content_gaps) / max(len(niche_topics), 1) * 100
             }
@@ -596,41 +695,26 @@ class AnalyticsAgent(BaseAgent):
         except Exception as e:
             return {"error": f"Content gap analysis failed: {str(e)}"}
     
+    def _topic_counts(self, videos: List[Dict[str, Any]]) -> Counter:
+        """Count topic words across video titles and descriptions"""
+        stop_words = self.enhanced_insights.stop_words
+        topics = Counter()
+        for video in videos:
+            text = f"{video.get('title', '')} {video.get('description', '')}".lower()
+            topics.update(token for token in _TOPIC_TOKEN_RE.findall(text) if token not in stop_words)
+        return topics
+    
     def get_trend_analysis(self, keywords: List[str]) -> Dict[str, Any]:
         """Analyze trends for given keywords"""
         try:
             trend_data = {}
             
-            for keyword in keywords[:5]:  # Limit to 5 keywords
-                # Search for recent videos
-                recent_videos = self.youtube_service.search_videos_by_keywords(keyword, max_results=20)
-                
-                if recent_videos:
-                    # Analyze engagement patterns
-                    engagement_rates = []
-                    view_counts = []
-                    
-                    for video in recent_videos:
-                        video_id = video.get('id', {}).get('videoId')
-                        if video_id:
-                            video_info = self.youtube_service.get_video_info(video_id)
-                            if video_info:
-                                views = video_info.get('view_count', 0)
-                                likes = video_info.get('like_count', 0)
-                                comments = video_info.get('comment_count', 0)
-                                
-                                if views > 0:
-                                    engagement_rate = ((likes + comments) / views) * 100
-                                    engagement_rates.append(engagement_rate)
-                                    view_counts.append(views)
-                    
-                    if engagement_rates:
-                        trend_data[keyword] = {
-                            "avg_engagement_rate": sum(engagement_rates) / len(engagement_rates),
-                            "avg_views": sum(view_counts) / len(view_counts),
-                            "video_count": len(recent_videos),
-                            "trend_strength": "High" if sum(engagement_rates) / len(engagement_rates) > 3 else "Medium"
-                        }
+            # Keywords are analyzed concurrently (limit to 5); map keeps their order
+            keywords = keywords[:5]
+            if keywords:
+                for keyword, keyword_trend in zip(keywords, self._io_pool.map(self._keyword_trend, keywords)):
+                    if keyword_trend:
+                        trend_data[keyword] = keyword_trend
             
             # Generate AI insights on trends
             trend_insights = self.ai_service.generate_insights(trend_data, "trend analysis")
@@ -638,19 +722,57 @@ class AnalyticsAgent(BaseAgent):
             return {
                 "trend_data": trend_data,
                 "trend_insights": trend_insights,
-                "top_trending_keywords": sorted(trend_data.items(), key=lambda x: x[1].get('avg_engagement_rate', 0), reverse=True)[:3]
+                "top_trending_keywords": heapq.nlargest(3, trend_data.items(), key=lambda x: x[1].get('avg_engagement_rate', 0))
             }
             
         except Exception as e:
             return {"error": f"Trend analysis failed: {str(e)}"}
     
+    def _keyword_trend(self, keyword: str) -> Optional[Dict[str, Any]]:
+        """Engagement pattern of recent videos for one keyword"""
+        # Search for recent videos
+        recent_videos = self.youtube_service.search_videos_by_keywords(keyword, max_results=20)
+        if not recent_videos:
+            return None
+        
+        # Fetch video stats in one batched videos.list call (search results carry the plain video ID)
+        video_ids = [video['id'] for video in recent_videos if video.get('id')]
+        stats_map = self.youtube_service.get_videos_info(video_ids)
+        video_infos = [stats_map.get(video_id) for video_id in video_ids]
+        
+        # Analyze engagement patterns
+        engagement_rates = []
+        view_counts = []
+        for video_info in video_infos:
+            if video_info:
+                views = video_info.get('view_count', 0)
+                likes = video_info.get('like_count', 0)
+                comments = video_info.get('comment_count', 0)
+                
+                if views > 0:
+                    engagement_rate = ((likes + comments) / views) * 100
+                    engagement_rates.append(engagement_rate)
+                    view_counts.append(views)
+        
+        if not engagement_rates:
+            return None
+        return {
+            "avg_engagement_rate": sum(engagement_rates) / len(engagement_rates),
+            "avg_views": sum(view_counts) / len(view_counts),
+            "video_count": len(recent_videos),
+            "trend_strength": "High" if sum(engagement_rates) / len(engagement_rates) > 3 else "Medium"
+        }
+    
     def get_competitor_analysis(self, channel_id: str, competitor_channels: List[str]) -> Dict[str, Any]:
         """Analyze performance against competitors"""
         try:
             competitor_data = {}
             
+            # Fetch the main channel and competitors (limit to 5) concurrently
+            competitor_channels = competitor_channels[:5]
+            main_channel, *comp_channels = self._io_pool.map(self.get_channel_analytics, [channel_id, *competitor_channels])
+            
             # Analyze main channel
-            main_channel = self.get_channel_analytics(channel_id)
             if "error" not in main_channel:
                 competitor_data["main_channel"] = {
                     "engagement_rate": main_channel.get("metrics", {}).get("channel_engagement_rate", 0),
@@ -659,8 +781,7 @@ class AnalyticsAgent(BaseAgent):
                 }
             
             # Analyze competitors
-            for comp_channel_id in competitor_channels[:5]:  # Limit to 5 competitors
-                comp_channel = self.get_channel_analytics(comp_channel_id)
+            for comp_channel_id, comp_channel in zip(competitor_channels, comp_channels):
                 if "error" not in comp_channel:
                     competitor_data[comp_channel_id] = {
                         "engagement_rate": comp_channel.get("metrics", {}).get("channel_engagement_rate", 0),
@@ -691,20 +812,11 @@ class AnalyticsAgent(BaseAgent):
         if not competitors:
             return {"position": "No competitors analyzed", "strengths": [], "weaknesses": []}
         
-        # Calculate rankings
-        engagement_ranking = sorted(competitors, key=lambda x: x.get("engagement_rate", 0), reverse=True)
-        views_ranking = sorted(competitors, key=lambda x: x.get("avg_views", 0), reverse=True)
-        
-        # Find main channel position
-        engagement_position = 1
-        for comp in engagement_ranking:
-            if comp.get("engagement_rate", 0) > main_channel.get("engagement_rate", 0):
-                engagement_position += 1
-        
-        views_position = 1
-        for comp in views_ranking:
-            if comp.get("avg_views", 0) > main_channel.get("avg_views", 0):
-                views_position += 1
+        # Find main channel position by counting competitors ahead of it
+        main_engagement = main_channel.get("engagement_rate", 0)
+        main_views = main_channel.get("avg_views", 0)
+        engagement_position = 1 + sum(1 for comp in competitors if comp.get("engagement_rate", 0) > main_engagement)
+        views_position = 1 + sum(1 for comp in competitors if comp.get("avg_views", 0) > main_views)
         
         total_competitors = len(competitors)
         
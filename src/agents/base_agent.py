@@ -4,28 +4,40 @@ Base Agent Class for YouTube Analytics AI System
 
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional
+import json
 import logging
 import os
+from functools import lru_cache
 from src.services.ai_service import AIService
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def default_model_name() -> str:
+    """Default model, resolved once on first use (after any .env has been loaded)"""
+    # Use OpenAI by default for production, fallback to Ollama if needed
+    if os.getenv('OPENAI_API_KEY'):
+        return os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
+    return os.getenv('OLLAMA_MODEL', 'gemma3:latest')
+
+
+@lru_cache(maxsize=8)
+def get_ai_service(model_name: str) -> AIService:
+    """Shared AIService per model, so agents reuse one client and its caches"""
+    return AIService(model_name)
+
+
 class BaseAgent(ABC):
     """Base class for all agents"""
     
+    def __init_subclass__(cls, **kwargs):
+        """One logger per agent class rather than a lookup per instance"""
+        super().__init_subclass__(**kwargs)
+        cls.logger = logging.getLogger(cls.__name__)
+    
     def __init__(self, model_name: Optional[str] = None):
-        # Use OpenAI by default for production, fallback to Ollama if needed
-        if not model_name:
-            # Check if OpenAI API key is available
-            if os.getenv('OPENAI_API_KEY'):
-                model_name = os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
-            else:
-                # Fallback to Ollama
-                model_name = os.getenv('OLLAMA_MODEL', 'gemma3:latest')
-        
-        self.ai_service = AIService(model_name)
-        self.logger = logging.getLogger(self.__class__.__name__)
+        self.ai_service = get_ai_service(model_name or default_model_name())
     
     @abstractmethod
     def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -38,6 +50,12 @@ class BaseAgent(ABC):
         if data:
             self.logger.debug(f"Data: {data}")
     
+    @staticmethod
+    def _compact(value: Any, max_chars: int = 2000) -> str:
+        """Serialize a value for a prompt, truncated to max_chars"""
+        text = value if isinstance(value, str) else json.dumps(value, default=str)
+        return text if len(text) <= max_chars else text[:max_chars] + "..."
+    
     def handle_error(self, error: Exception, context: str = ""):
         """Handle and log errors"""
         self.logger.error(f"Error in {self.__class__.__name__} - {context}: {str(error)}")
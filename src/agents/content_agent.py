@@ -2,7 +2,8 @@
 Content Agent for generating social media posts and content
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List
+from concurrent.futures import ThreadPoolExecutor
 from src.agents.base_agent import BaseAgent
 
 class ContentAgent(BaseAgent):
@@ -19,11 +20,13 @@ class ContentAgent(BaseAgent):
             
             self.log_activity("Generating content", {"content_type": content_type})
             
-            # Generate content based on analytics
-            content = self.generate_content(analytics_data, content_type)
-            
-            # Generate image description for the content
-            image_prompt = self.generate_image_prompt(content, analytics_data)
+            # Generate content and image description concurrently; the image
+            # prompt is built from analytics alone so neither call waits on the other
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                content_future = pool.submit(self.generate_content, analytics_data, content_type)
+                image_future = pool.submit(self.generate_image_prompt_from_analytics, analytics_data, content_type)
+                content = content_future.result()
+                image_prompt = image_future.result()
             
             return {
                 "content": content,
@@ -38,16 +41,35 @@ class ContentAgent(BaseAgent):
         except Exception as e:
             return self.handle_error(e, "Content generation")
     
-    def generate_content(self, analytics_data: Dict[str, Any], content_type: str) -> str:
-        """Generate content based on analytics"""
-        context = f"""
+    @staticmethod
+    def _analytics_context(analytics_data: Dict[str, Any]) -> str:
+        """Build the analytics summary used as generation context"""
+        return f"""
         Analytics Summary:
         - Video performance: {analytics_data.get('video_analytics', {})}
         - Comment insights: {analytics_data.get('comment_analysis', {})}
         - Transcript analysis: {analytics_data.get('transcript_analysis', {})}
         """
-        
-        return self.ai_service.generate_content(context, content_type)
+    
+    def generate_content(self, analytics_data: Dict[str, Any], content_type: str) -> str:
+        """Generate content based on analytics"""
+        return self.ai_service.generate_content(self._analytics_context(analytics_data), content_type)
+    
+    def generate_content_stream(self, analytics_data: Dict[str, Any], content_type: str) -> Iterator[str]:
+        """Stream content chunks based on analytics"""
+        return self.ai_service.generate_content_stream(self._analytics_context(analytics_data), content_type)
+    
+    @staticmethod
+    def _image_context(analytics_data: Dict[str, Any]) -> Dict[str, Any]:
+        """The few analytics fields that shape an image prompt"""
+        video = analytics_data.get('video_analytics', {})
+        sentiment = analytics_data.get('comment_analysis', {}).get('sentiment_breakdown', {})
+        return {
+            "title": video.get('title'),
+            "channel": video.get('channel'),
+            "top_tags": video.get('tags', [])[:5],
+            "dominant_sentiment": max(sentiment, key=sentiment.get) if sentiment else None
+        }
     
     def generate_image_prompt(self, content: str, analytics_data: Dict[str, Any]) -> str:
         """Generate image prompt for the content"""
@@ -55,9 +77,21 @@ class ContentAgent(BaseAgent):
         Based on this content and analytics, create an image prompt for generating a relevant image:
         
         Content: {content[:500]}...
-        Analytics: {analytics_data}
+        Analytics: {self._compact(self._image_context(analytics_data))}
+        
+        Generate a clear, descriptive image prompt that would create an engaging visual for this content.
+        """
+        
+        return self.ai_service.generate_content(prompt, "image prompt") 
+    
+    def generate_image_prompt_from_analytics(self, analytics_data: Dict[str, Any], content_type: str) -> str:
+        """Generate image prompt from analytics alone"""
+        prompt = f"""
+        Based on these analytics, create an image prompt for generating a relevant image for a {content_type}:
+        
+        Analytics: {self._compact(self._image_context(analytics_data))}
         
         Generate a clear, descriptive image prompt that would create an engaging visual for this content.
         """
         
-        return self.ai_service.generate_content(prompt, "image prompt") 
\ No newline at end of file
+        return self.ai_service.generate_content(prompt, "image prompt")
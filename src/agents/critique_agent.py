@@ -19,14 +19,20 @@ class CritiqueAgent(BaseAgent):
             
             self.log_activity("Starting critique", {"content_type": content_type})
             
-            # Analyze the content
-            critique = self.analyze_content(content, content_type)
+            # Critique, improvements and rewrite in one round-trip
+            combined = self.ai_service.critique_full(self._compact(content), content_type)
+            critique = combined.get('critique')
+            improvements = combined.get('improvements')
+            improved_text = combined.get('improved_text')
             
-            # Generate improvements
-            improvements = self.generate_improvements(content, critique)
-            
-            # Create improved version
-            improved_content = self.create_improved_version(content, improvements)
+            if isinstance(critique, dict) and isinstance(improvements, list) and improved_text:
+                improvements = [str(item) for item in improvements]
+                improved_content = self._with_improvements(content, str(improved_text), improvements)
+            else:
+                # Fall back to the step-by-step chain
+                critique = self.analyze_content(content, content_type)
+                improvements = self.generate_improvements(content, critique)
+                improved_content = self.create_improved_version(content, improvements)
             
             return {
                 "original_content": content,
@@ -47,35 +53,46 @@ class CritiqueAgent(BaseAgent):
         # Use our AI service to critique the content
         return self.ai_service.critique_and_improve(str(content), content_type)
     
+    def _content_text(self, content: Any) -> str:
+        """The generated text of a content result, truncated for prompts"""
+        if isinstance(content, dict) and 'content' in content:
+            content = content['content']
+        return self._compact(content, max_chars=1000)
+    
     def generate_improvements(self, content: Dict[str, Any], critique: Dict[str, Any]) -> List[str]:
         """Generate specific improvement suggestions"""
+        if isinstance(critique, dict):
+            critique = {key: critique.get(key) for key in ('score', 'weaknesses', 'suggestions')}
         prompt = f"""
         Based on this critique, provide specific, actionable improvements:
         
-        Content: {content}
-        Critique: {critique}
+        Content: {self._content_text(content)}
+        Critique: {self._compact(critique)}
         
         Provide 3-5 specific, actionable improvements that would enhance the content.
+        Return JSON: {{"improvements": ["...", ...]}}
         """
         
-        response = self.ai_service.generate_response(prompt)
-        # Split response into individual improvements
-        improvements = [line.strip() for line in response.split('\n') if line.strip()]
-        return improvements
+        improvements = self.ai_service.generate_json(prompt).get('improvements', [])
+        return [str(item) for item in improvements] if isinstance(improvements, list) else []
     
     def create_improved_version(self, content: Dict[str, Any], improvements: List[str]) -> Dict[str, Any]:
         """Create an improved version of the content"""
         prompt = f"""
         Create an improved version of this content incorporating these improvements:
         
-        Original Content: {content}
-        Improvements: {improvements}
+        Original Content: {self._content_text(content)}
+        Improvements: {self._compact(improvements)}
         
         Generate the improved content that addresses all the suggested improvements.
         """
         
         improved_text = self.ai_service.generate_response(prompt)
-        
+        return self._with_improvements(content, improved_text, improvements)
+    
+    @staticmethod
+    def _with_improvements(content: Dict[str, Any], improved_text: str, improvements: List[str]) -> Dict[str, Any]:
+        """Attach the improved text to the content, keeping its structure"""
         # Try to maintain the original structure
         if isinstance(content, dict):
             improved_content = content.copy()
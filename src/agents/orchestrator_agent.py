@@ -2,20 +2,35 @@
 Orchestrator Agent for coordinating all agents
 """
 
+import threading
 from typing import Dict, Any, List
+from functools import lru_cache
+from cachetools import TTLCache
 from src.agents.base_agent import BaseAgent
 from src.agents.analytics_agent import AnalyticsAgent
 from src.agents.content_agent import ContentAgent
 from src.agents.critique_agent import CritiqueAgent
 
+@lru_cache(maxsize=None)
+def _get_agent(cls, *args):
+    """Shared agent instance per (class, constructor args)
+
+    Unbounded on purpose: there are three agent classes and the args come from
+    configuration, and evicting an AnalyticsAgent would leak its thread pools.
+    """
+    return cls(*args)
+
 class OrchestratorAgent(BaseAgent):
     """Agent for orchestrating the workflow between all other agents"""
     
     def __init__(self, api_key: str, model_name: str = "gemma3:latest"):
         super().__init__(model_name)
-        self.analytics_agent = AnalyticsAgent(api_key, model_name)
-        self.content_agent = ContentAgent(model_name)
-        self.critique_agent = CritiqueAgent(model_name)
+        self.analytics_agent = _get_agent(AnalyticsAgent, api_key, model_name)
+        self.content_agent = _get_agent(ContentAgent, model_name)
+        self.critique_agent = _get_agent(CritiqueAgent, model_name)
+        # Back-to-back workflows for one video reuse its analytics for five minutes
+        self._analytics_cache = TTLCache(maxsize=512, ttl=300)
+        self._analytics_lock = threading.Lock()
     
     def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Orchestrate the complete workflow"""
@@ -32,9 +47,7 @@ class OrchestratorAgent(BaseAgent):
             
             # Step 1: Analytics
             if 'analytics' in workflow_steps:
-                self.log_activity("Running analytics agent")
-                analytics_result = self.analytics_agent.process({'video_id': video_id})
-                results['analytics'] = analytics_result
+                results['analytics'] = self.get_analytics(video_id)
             
             # Step 2: Content Generation
             if 'content' in workflow_steps:
@@ -71,6 +84,21 @@ class OrchestratorAgent(BaseAgent):
         except Exception as e:
             return self.handle_error(e, "Workflow orchestration")
     
+    def get_analytics(self, video_id: str) -> Dict[str, Any]:
+        """Run the analytics agent for a video, reusing a recent result"""
+        with self._analytics_lock:
+            cached = self._analytics_cache.get(video_id)
+        if cached is not None:
+            self.log_activity("Reusing cached analytics", {"video_id": video_id})
+            return cached
+        
+        self.log_activity("Running analytics agent")
+        analytics_result = self.analytics_agent.process({'video_id': video_id})
+        if 'error' not in analytics_result:
+            with self._analytics_lock:
+                self._analytics_cache[video_id] = analytics_result
+        return analytics_result
+    
     def generate_workflow_summary(self, results: Dict[str, Any], workflow_steps: List[str]) -> str:
         """Generate a summary of the complete workflow"""
         context = f"""
@@ -3,7 +3,9 @@ YouTube Analytics AI Backend API
 """
 
 import os
+import sys
 import logging
+import threading
 import re
 import json
 import numpy as np
@@ -15,21 +17,41 @@ matplotlib.use('Agg')  # Use non-interactive backend
 import matplotlib.pyplot as plt
 import seaborn as sns
 from urllib.parse import urlparse, parse_qs
+from operator import itemgetter
+from cachetools import TTLCache
 from googleapiclient.discovery import build
 import nltk
 from nltk.sentiment import SentimentIntensityAnalyzer
 import langid
 from datetime import datetime
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
 from flask_cors import CORS
+from flask.json.provider import DefaultJSONProvider
+import orjson
 from openai import OpenAI
 from src.agents.analytics_agent import AnalyticsAgent
+from src.agents.content_agent import ContentAgent
 from dotenv import load_dotenv
 
 load_dotenv()
 
+class ORJSONProvider(DefaultJSONProvider):
+    """jsonify through orjson; Flask's default hook still covers dates, decimals and dataclasses"""
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 # Create Flask app
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # Configure CORS after app is created
 CORS(app, resources={
@@ -200,6 +222,14 @@ class YouTubeCommentAnalyzer:
         else:
             return 'neutral'
 
+    def classify_sentiments(self, texts):
+        """Classify many texts at once; labels are picked from the compound scores in one vectorized pass."""
+        compound = np.fromiter(
+            (self.sia.polarity_scores(text)['compound'] if isinstance(text, str) and text.strip() else 0.0
+             for text in texts),
+            dtype=np.float64, count=len(texts))
+        return np.select([compound >= 0.05, compound <= -0.05], ['positive', 'negative'], 'neutral')
+
     def analyze_comments(self, comments):
         """Analyze comments and return comprehensive results."""
         if not comments:
@@ -216,7 +246,7 @@ class YouTubeCommentAnalyzer:
             df_english = df.copy()
         
         # Add sentiment analysis
-        df_english['sentiment'] = df_english['Comment'].apply(self.classify_sentiment)
+        df_english['sentiment'] = self.classify_sentiments(df_english['Comment'].tolist())
         df_english['sarcasm_label'] = df_english['Comment'].apply(self.detect_sarcasm)
         
         # Calculate statistics
@@ -327,7 +357,7 @@ def generate_tagged_video_insights(analysis_summary, video_info=None, sample_com
         )
         
         raw = response.choices[0].message.content.strip()
-        print("OpenAI enhanced response:", raw)
+        logger.debug("OpenAI enhanced response: %s", raw)
 
         # Clean and parse JSON response
         cleaned = re.sub(r"^```(?:json)?\s*|```$", "", raw.strip(), flags=re.MULTILINE).strip()
@@ -353,10 +383,10 @@ def generate_tagged_video_insights(analysis_summary, video_info=None, sample_com
         return enhanced_insights
 
     except json.JSONDecodeError as e:
-        print(f"JSON parsing error: {e}")
+        logger.error(f"JSON parsing error: {e}")
         return generate_fallback_insights(analysis_summary, video_info)
     except Exception as e:
-        print(f"OpenAI error: {e}")
+        logger.error(f"OpenAI error: {e}")
         return generate_fallback_insights(analysis_summary, video_info)
 
 
@@ -586,7 +616,7 @@ def generate_priority_recommendations(tagged_insights):
             })
     
     # Sort by estimated impact
-    recommendations.sort(key=lambda x: x['impact'], reverse=True)
+    recommendations.sort(key=itemgetter('impact'), reverse=True)
     return recommendations[:3]  # Return top 3
 
 
@@ -636,6 +666,23 @@ logger = logging.getLogger(__name__)
 
 YOUTUBE_API_KEY = os.environ.get("YOUTUBE_API_KEY", "YOUR_API_KEY")
 analytics_agent = AnalyticsAgent(YOUTUBE_API_KEY)
+content_agent = ContentAgent()
+
+# Short-lived response cache for polled endpoints; stats move on a scale of minutes
+RESPONSE_CACHE_TTL = 300
+_response_cache = TTLCache(maxsize=1024, ttl=RESPONSE_CACHE_TTL)
+_response_cache_lock = threading.Lock()
+
+def _cached_result(key, compute):
+    """Return a cached result for key, computing and storing it on a miss (errors are not cached)"""
+    with _response_cache_lock:
+        result = _response_cache.get(key)
+    if result is None:
+        result = compute()
+        if not (isinstance(result, dict) and 'error' in result):
+            with _response_cache_lock:
+                _response_cache[key] = result
+    return result
 
 @app.route('/health', methods=['GET'])
 def health():
@@ -684,7 +731,7 @@ def analyze_video():
             analysis_results.get('sample_comments', [])
         )
         
-        print("Generated enhanced insights:", tagged_insights)
+        logger.debug("Generated enhanced insights: %s", tagged_insights)
         
         # Calculate additional metrics for frontend
         additional_metrics = {
@@ -730,7 +777,7 @@ def get_analytics():
         video_id = data.get('video_id')
         if not video_id:
             return jsonify({"error": "Video ID is required"}), 400
-        result = analytics_agent.process({'video_id': video_id})
+        result = _cached_result(('analytics', video_id), lambda: analytics_agent.process({'video_id': video_id}))
         return jsonify(result)
     except Exception as e:
         logger.error(f"Error in get_analytics: {str(e)}")
@@ -744,17 +791,38 @@ def get_comments():
         video_id = data.get('video_id')
         if not video_id:
             return jsonify({"error": "Video ID is required"}), 400
-        result = analytics_agent.comment_analytics(video_id)
+        result = _cached_result(('comments', video_id), lambda: analytics_agent.comment_analytics(video_id))
         return jsonify(result)
     except Exception as e:
         logger.error(f"Error in get_comments: {str(e)}")
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/content/stream', methods=['POST'])
+def stream_content():
+    """Stream generated content for a video as server-sent events"""
+    try:
+        data = request.get_json()
+        video_id = data.get('video_id')
+        content_type = data.get('content_type', 'social_post')
+        if not video_id:
+            return jsonify({"error": "Video ID is required"}), 400
+        analytics = _cached_result(('analytics', video_id), lambda: analytics_agent.process({'video_id': video_id}))
+        
+        def generate():
+            for chunk in content_agent.generate_content_stream(analytics, content_type):
+                yield f"data: {json.dumps({'content': chunk})}\n\n"
+            yield f"data: {json.dumps({'done': True})}\n\n"
+        
+        return Response(stream_with_context(generate()), mimetype="text/event-stream")
+    except Exception as e:
+        logger.error(f"Error in stream_content: {str(e)}")
+        return jsonify({"error": str(e)}), 500
+
 @app.route('/api/channel/<channel_id>', methods=['GET'])
 def channel_analytics(channel_id):
     """Get comprehensive channel analytics"""
     try:
-        result = analytics_agent.get_channel_analytics(channel_id)
+        result = _cached_result(('channel', channel_id), lambda: analytics_agent.get_channel_analytics(channel_id))
         return jsonify(result)
     except Exception as e:
         logger.error(f"Error in channel_analytics: {str(e)}")
@@ -1002,13 +1070,9 @@ def list_routes():
     return "<br>".join(sorted(output))
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=8000, debug=True)
-
-@app.after_request
-def after_request(response):
-    """Add CORS headers to all responses"""
-    response.headers.add('Access-Control-Allow-Origin', '*')
-    response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization,X-Requested-With')
-    response.headers.add('Access-Control-Allow-Methods', 'GET,POST,PUT,DELETE,OPTIONS')
-    response.headers.add('Access-Control-Allow-Credentials', 'true')
-    return response 
\ No newline at end of file
+    if '--dev' in sys.argv:
+        # Flask development server with the reloader and debugger
+        app.run(host="0.0.0.0", port=8000, debug=True)
+    else:
+        # Production: 4 gevent workers so YouTube/LLM I/O doesn't serialize requests
+        os.execvp("gunicorn", ["gunicorn", "-w", "4", "-k", "gevent", "--worker-connections", "100", "-b", "0.0.0.0:8000", "src.app:app"])
@@ -192,6 +192,14 @@ class YouTubeCommentAnalyzer:
         else:
             return 'neutral'
 
+    def classify_sentiments(self, texts):
+        """Classify many texts at once; labels are picked from the compound scores in one vectorized pass."""
+        compound = np.fromiter(
+            (self.sia.polarity_scores(text)['compound'] if isinstance(text, str) and text.strip() else 0.0
+             for text in texts),
+            dtype=np.float64, count=len(texts))
+        return np.select([compound >= 0.05, compound <= -0.05], ['positive', 'negative'], 'neutral')
+
     def create_visualizations_base64(self, df):
         """Create visualizations and return as base64 encoded strings."""
         # Sentiment distribution pie chart
@@ -240,7 +248,7 @@ class YouTubeCommentAnalyzer:
             df_english = df.copy()
 
         # Add sentiment analysis
-        df_english['sentiment'] = df_english['Comment'].apply(self.classify_sentiment)
+        df_english['sentiment'] = self.classify_sentiments(df_english['Comment'].tolist())
         df_english['sarcasm_label'] = df_english['Comment'].apply(self.detect_sarcasm)
 
         # Calculate statistics
@@ -1,12 +1,41 @@
 import openai
+import httpx
+import atexit
 import json
 from typing import Dict, List, Any, Optional
 import logging
 import os
+import hashlib
+import sqlite3
+import time
+import threading
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import LRUCache
+
+# SQLite file persisting batch AI results across runs; empty disables it
+AI_CACHE_DB = os.getenv('AI_CACHE_DB', 'ai_cache.db')
+# Stored results expire after this many seconds; bump the version to discard every stored result
+AI_CACHE_TTL = int(os.getenv('AI_CACHE_TTL', str(30 * 24 * 3600)))
+AI_CACHE_VERSION = 2
+# Cache files already created and purged by this process; instances after the first skip the work
+_ready_cache_dbs = set()
+_ready_cache_dbs_lock = threading.Lock()
+
+# Shared by every AIService instance so batch calls reuse threads instead of spawning a pool each time
+_AI_BATCH_EXEC = ThreadPoolExecutor(max_workers=8, thread_name_prefix='ai-batch')
+atexit.register(_AI_BATCH_EXEC.shutdown, wait=False)
+
+class AIBatchError(RuntimeError):
+    """Every batch of a batch analysis failed (backend down or unusable responses)"""
+
 
 class AIService:
     """AI service using OpenAI API for production use"""
     
+    _http_client = None
+    _http_client_lock = threading.Lock()
+    
     def __init__(self, model_name: str = "gpt-4o-mini", api_key: Optional[str] = None):
         self.model_name = model_name
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
@@ -14,7 +43,100 @@ class AIService:
         if not self.api_key:
             raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY environment variable.")
         
-        self.client = openai.OpenAI(api_key=self.api_key)
+        self.client = openai.OpenAI(api_key=self.api_key, http_client=self.shared_http_client())
+        
+        # Per-text results for the batch methods; comment streams repeat a lot
+        self._sentiment_cache = LRUCache(maxsize=10_000)
+        self._category_cache = LRUCache(maxsize=10_000)
+        self._cache_lock = threading.Lock()  # Instances are shared across agents and threads
+        self._cache_db = AI_CACHE_DB or None
+        self._init_cache_db()
+        
+    @classmethod
+    def shared_http_client(cls) -> httpx.Client:
+        """Lazily create the pooled HTTP/2 client shared by every instance"""
+        if cls._http_client is None:
+            with cls._http_client_lock:
+                if cls._http_client is None:
+                    cls._http_client = httpx.Client(
+                        http2=True,
+                        timeout=60.0,
+                        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+                    )
+                    atexit.register(cls._http_client.close)
+        return cls._http_client
+    
+    def _init_cache_db(self):
+        """Create the persistent AI result table and purge stale rows, once per process"""
+        if not self._cache_db:
+            return
+        with _ready_cache_dbs_lock:
+            if self._cache_db in _ready_cache_dbs:
+                return
+            try:
+                with closing(sqlite3.connect(self._cache_db)) as conn, conn:
+                    conn.execute('PRAGMA journal_mode=WAL')
+                    # Tables from before versioning hold position-matched results; drop them
+                    columns = {row[1] for row in conn.execute("PRAGMA table_info(ai_results)")}
+                    if columns and 'version' not in columns:
+                        conn.execute('DROP TABLE ai_results')
+                    conn.execute('''
+                        CREATE TABLE IF NOT EXISTS ai_results (
+                            kind TEXT NOT NULL,
+                            text_hash TEXT NOT NULL,
+                            result TEXT NOT NULL,
+                            version INTEGER NOT NULL,
+                            created_at REAL NOT NULL,
+                            PRIMARY KEY (kind, text_hash)
+                        )
+                    ''')
+                    conn.execute(
+                        "DELETE FROM ai_results WHERE version != ? OR created_at < ?",
+                        (AI_CACHE_VERSION, time.time() - AI_CACHE_TTL)
+                    )
+                _ready_cache_dbs.add(self._cache_db)
+            except sqlite3.Error as e:
+                logging.error(f"AI cache database unavailable: {e}")
+                self._cache_db = None
+    
+    @staticmethod
+    def _text_hash(text: str) -> str:
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()
+    
+    def _load_persisted(self, kind: str, texts: List[str], cache: LRUCache):
+        """Fill cache with stored results for texts"""
+        if not self._cache_db or not texts:
+            return
+        by_hash = {self._text_hash(text): text for text in texts}
+        hashes = list(by_hash)
+        try:
+            with closing(sqlite3.connect(self._cache_db)) as conn:
+                for start in range(0, len(hashes), 500):
+                    chunk = hashes[start:start + 500]
+                    rows = conn.execute(
+                        f"SELECT text_hash, result FROM ai_results WHERE kind = ? AND version = ? AND created_at >= ? "
+                        f"AND text_hash IN ({','.join('?' * len(chunk))})",
+                        [kind, AI_CACHE_VERSION, time.time() - AI_CACHE_TTL, *chunk]
+                    ).fetchall()
+                    for text_hash, result in rows:
+                        with self._cache_lock:
+                            cache[by_hash[text_hash]] = json.loads(result)
+        except sqlite3.Error as e:
+            logging.error(f"Error reading AI cache: {e}")
+    
+    def _persist(self, kind: str, results: Dict[str, Dict[str, Any]]):
+        """Store newly computed, index-verified results"""
+        if not self._cache_db or not results:
+            return
+        now = time.time()
+        try:
+            with closing(sqlite3.connect(self._cache_db)) as conn, conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO ai_results (kind, text_hash, result, version, created_at) VALUES (?, ?, ?, ?, ?)",
+                    [(kind, self._text_hash(text), json.dumps(result), AI_CACHE_VERSION, now) for text, result in results.items()]
+                )
+        except sqlite3.Error as e:
+            logging.error(f"Error writing AI cache: {e}")
         
     def generate_response(self, prompt: str, system_prompt: Optional[str] = None, max_tokens: int = 1000) -> str:
         """Generate a response using OpenAI"""
@@ -36,6 +158,49 @@ class AIService:
             logging.error(f"Error generating response: {e}")
             return f"Error: {str(e)}"
     
+    def generate_json(self, prompt: str, system_prompt: Optional[str] = None, max_tokens: int = 1000) -> Dict[str, Any]:
+        """Generate a JSON object response using JSON mode"""
+        try:
+            messages = []
+            if system_prompt:
+                messages.append({"role": "system", "content": system_prompt})
+            messages.append({"role": "user", "content": prompt})
+            
+            response = self.client.chat.completions.create(
+                model=self.model_name,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=0.7,
+                response_format={"type": "json_object"}
+            )
+            content = response.choices[0].message.content
+            return json.loads(content) if content else {}
+        except Exception as e:
+            logging.error(f"Error generating JSON response: {e}")
+            return {}
+    
+    def stream_response(self, prompt: str, system_prompt: Optional[str] = None, max_tokens: int = 1000):
+        """Yield response text chunks as the model produces them"""
+        try:
+            messages = []
+            if system_prompt:
+                messages.append({"role": "system", "content": system_prompt})
+            messages.append({"role": "user", "content": prompt})
+            
+            stream = self.client.chat.completions.create(
+                model=self.model_name,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=0.7,
+                stream=True
+            )
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            logging.error(f"Error streaming response: {e}")
+            yield f"Error: {str(e)}"
+    
     def analyze_sentiment(self, text: str) -> Dict[str, Any]:
         """Analyze sentiment of text"""
         system_prompt = """You are a sentiment analysis expert. Analyze the sentiment of the given text and return a JSON response with:
@@ -45,6 +210,11 @@ class AIService:
         
         Return only valid JSON without any additional text."""
         
+        with self._cache_lock:
+            cached = self._sentiment_cache.get(text)
+        if cached is not None:
+            return cached
+        
         prompt = f'Analyze the sentiment of: "{text}"'
         
         try:
@@ -54,7 +224,10 @@ class AIService:
                 start = response.find('{')
                 end = response.rfind('}') + 1
                 json_str = response[start:end]
-                return json.loads(json_str)
+                result = json.loads(json_str)
+                with self._cache_lock:
+                    self._sentiment_cache[text] = result
+                return result
             else:
                 return {
                     "sentiment": "neutral",
@@ -77,6 +250,11 @@ class AIService:
         
         Return only valid JSON without any additional text."""
         
+        with self._cache_lock:
+            cached = self._category_cache.get(comment)
+        if cached is not None:
+            return cached
+        
         prompt = f'Categorize this comment: "{comment}"'
         
         try:
@@ -85,7 +263,10 @@ class AIService:
                 start = response.find('{')
                 end = response.rfind('}') + 1
                 json_str = response[start:end]
-                return json.loads(json_str)
+                result = json.loads(json_str)
+                with self._cache_lock:
+                    self._category_cache[comment] = result
+                return result
             else:
                 return {
                     "category": "other",
@@ -99,16 +280,133 @@ class AIService:
                 "reasoning": f"Error: {str(e)}"
             }
     
-    def generate_content(self, context: str, content_type: str) -> str:
-        """Generate content based on context"""
+    def _analyze_batch(self, texts: List[str], system_prompt: str, instruction: str,
+                       fallback: Dict[str, Any], batch_size: int, cache: LRUCache, kind: str) -> List[Dict[str, Any]]:
+        """Run one prompt per batch of texts and return one JSON result per text
+        
+        Raises AIBatchError when texts had to be sent and every batch failed.
+        """
+        # Results are model-specific
+        kind = f"{kind}:{self.model_name}"
+        
+        # Only send texts not already analyzed (in memory or on disk), each once
+        with self._cache_lock:
+            pending = list(dict.fromkeys(text for text in texts if text not in cache))
+        self._load_persisted(kind, pending, cache)
+        with self._cache_lock:
+            pending = [text for text in pending if text not in cache]
+        batches = [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+        
+        # Batches are independent requests; overlap their network latency
+        if batches:
+            all_results = list(_AI_BATCH_EXEC.map(
+                lambda batch: self._run_batch(batch, system_prompt, instruction), batches
+            ))
+            
+            # Nothing usable came back at all: report it so callers can back off
+            if not any(all_results):
+                raise AIBatchError(f"All {len(batches)} {kind} batches failed")
+            
+            # Cache parsed results by their verified index; failed batches are retried on the
+            # next call. Only these index-verified results reach the persistent cache.
+            new_results = {}
+            for batch, batch_results in zip(batches, all_results):
+                new_results.update((batch[position], result) for position, result in batch_results.items())
+            with self._cache_lock:
+                cache.update(new_results)
+            self._persist(kind, new_results)
+        
+        with self._cache_lock:
+            return [cache.get(text) or dict(fallback, reasoning="Could not parse AI response") for text in texts]
+    
+    def _run_batch(self, batch: List[str], system_prompt: str, instruction: str) -> Dict[int, Dict[str, Any]]:
+        """Send one numbered batch and return its JSON results keyed by position in the batch
+        
+        Results are matched to texts by their "index" field, never by array order.
+        If the indexes don't cover the batch exactly once each, the whole batch is
+        dropped so a skipped or merged entry can't shift results onto other texts.
+        """
+        numbered = "\n".join(f'{i}. "{text}"' for i, text in enumerate(batch, 1))
+        prompt = f"{instruction}:\n{numbered}"
+        
+        try:
+            response = self.generate_response(prompt, system_prompt, max_tokens=100 * len(batch))
+            parsed = []
+            if '[' in response and ']' in response:
+                start_idx = response.find('[')
+                end_idx = response.rfind(']') + 1
+                parsed = json.loads(response[start_idx:end_idx])
+            
+            results = {}
+            for item in parsed:
+                if not isinstance(item, dict):
+                    continue
+                item = dict(item)
+                index = item.pop('index', None)
+                if isinstance(index, str) and index.strip().isdigit():
+                    index = int(index)
+                if isinstance(index, bool) or not isinstance(index, int) or not 1 <= index <= len(batch) or index - 1 in results:
+                    break
+                results[index - 1] = item
+            else:
+                if len(results) == len(batch):
+                    return results
+            logging.warning(f"Dropping AI batch of {len(batch)}: indexes did not cover the batch")
+            return {}
+        except Exception as e:
+            logging.error(f"Error analyzing batch: {e}")
+            return {}
+    
+    def analyze_sentiment_batch(self, texts: List[str], batch_size: int = 25) -> List[Dict[str, Any]]:
+        """Analyze sentiment of many texts with one request per batch"""
+        system_prompt = """You are a sentiment analysis expert. Analyze the sentiment of each numbered text and return a JSON array with one object per text, each with:
+        - index: the number of the text
+        - sentiment: positive, negative, or neutral
+        - confidence: 0.0 to 1.0
+        - reasoning: brief explanation
+        
+        Return only a valid JSON array without any additional text."""
+        
+        return self._analyze_batch(
+            texts, system_prompt, "Analyze the sentiment of these texts",
+            {"sentiment": "neutral", "confidence": 0.5}, batch_size, self._sentiment_cache, "sentiment"
+        )
+    
+    def categorize_comment_batch(self, comments: List[str], batch_size: int = 25) -> List[Dict[str, Any]]:
+        """Categorize many comments with one request per batch"""
+        system_prompt = """You are a YouTube comment categorization expert. Categorize each numbered comment and return a JSON array with one object per comment, each with:
+        - index: the number of the comment
+        - category: question, feedback, spam, appreciation, criticism, suggestion, or other
+        - confidence: 0.0 to 1.0
+        - reasoning: brief explanation
+        
+        Return only a valid JSON array without any additional text."""
+        
+        return self._analyze_batch(
+            comments, system_prompt, "Categorize these comments",
+            {"category": "other", "confidence": 0.5}, batch_size, self._category_cache, "category"
+        )
+    
+    @staticmethod
+    def _content_prompts(context: str, content_type: str):
+        """System and user prompts for content generation"""
         system_prompt = f"""You are a content creation expert specializing in {content_type}. 
         Generate engaging, relevant, and high-quality content based on the provided context.
         Be creative, informative, and audience-focused."""
         
         prompt = f"Generate {content_type} based on this context: {context}"
-        
+        return prompt, system_prompt
+    
+    def generate_content(self, context: str, content_type: str) -> str:
+        """Generate content based on context"""
+        prompt, system_prompt = self._content_prompts(context, content_type)
         return self.generate_response(prompt, system_prompt, max_tokens=500)
     
+    def generate_content_stream(self, context: str, content_type: str):
+        """Stream content based on context"""
+        prompt, system_prompt = self._content_prompts(context, content_type)
+        return self.stream_response(prompt, system_prompt, max_tokens=500)
+    
     def critique_and_improve(self, content: str, feedback_type: str = "general") -> Dict[str, Any]:
         """Critique and suggest improvements"""
         system_prompt = """You are a content critique expert. Analyze the given content and provide improvement suggestions. Return JSON with:
@@ -143,6 +441,19 @@ class AIService:
                 "suggestions": ["Review content manually"]
             }
     
+    def critique_full(self, content: str, feedback_type: str = "general") -> Dict[str, Any]:
+        """Critique, list improvements and rewrite content in a single call"""
+        system_prompt = """You are a content critique expert. Critique the given content, list improvements and rewrite it. Return JSON with:
+        - critique: object with score (1-10 rating), strengths, weaknesses and suggestions (lists)
+        - improvements: list of 3-5 specific, actionable improvements
+        - improved_text: the improved content addressing all the improvements
+        
+        Return only valid JSON without any additional text."""
+        
+        prompt = f"Critique and improve this {feedback_type} content: {content}"
+        
+        return self.generate_json(prompt, system_prompt, max_tokens=1500)
+    
     def generate_insights(self, data: Dict[str, Any], insight_type: str) -> Dict[str, Any]:
         """Generate insights from data"""
         system_prompt = f"""You are a YouTube analytics expert. Analyze the provided data and generate {insight_type} insights. 
@@ -9,13 +9,13 @@ import math
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from collections import Counter, defaultdict
+from operator import itemgetter
 import numpy as np
 from textblob import TextBlob
 import nltk
 from nltk.tokenize import word_tokenize, sent_tokenize
 from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
-import requests
 from PIL import Image
 import io
 
@@ -465,7 +465,7 @@ class EnhancedInsightsService:
                 })
         
         # Sort by influence score
-        influencers.sort(key=lambda x: x["influence_score"], reverse=True)
+        influencers.sort(key=itemgetter("influence_score"), reverse=True)
         
         return influencers[:10]  # Top 10 influencers
     
@@ -2,24 +2,88 @@
 Enhanced YouTube Service with Transcript and Advanced Analytics
 """
 
-import asyncio
+import heapq
+from operator import itemgetter
+import threading
 from typing import Dict, Any, List, Optional
 import logging
 import re
 import json
 from datetime import datetime, timedelta
 from urllib.parse import urlparse, parse_qs
+from cachetools import TTLCache
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 import nltk
 from nltk.sentiment import SentimentIntensityAnalyzer
 import langid
-import requests
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api.formatters import TextFormatter
 
 logger = logging.getLogger(__name__)
 
+VIDEOS_LIST_MAX_IDS = 50  # videos.list accepts up to 50 comma-separated IDs
+
+# Sponsorship detection patterns, compiled once at import
+_SPONSOR_INDICATOR_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'sponsored\s+by',
+    r'this\s+video\s+is\s+sponsored\s+by',
+    r'thanks\s+to\s+.*?\s+for\s+sponsoring',
+    r'partnered\s+with',
+    r'in\s+partnership\s+with',
+    r'promotion\s+code',
+    r'discount\s+code',
+    r'use\s+code\s+[A-Z0-9]+',
+    r'promo\s+code',
+    r'coupon\s+code',
+    r'check\s+out\s+.*?\s+link\s+in\s+description',
+    r'link\s+in\s+description',
+    r'click\s+the\s+link\s+below',
+    r'visit\s+.*?\s+com',
+    r'go\s+to\s+.*?\s+com',
+    r'head\s+over\s+to',
+    r'check\s+out\s+.*?\s+website',
+    r'visit\s+.*?\s+website',
+    r'go\s+to\s+.*?\s+website'
+]]
+
+# Common sponsorship companies and brands
+_SPONSOR_COMPANIES = (
+    'nordvpn', 'expressvpn', 'surfshark', 'protonvpn', 'cyberghost',
+    'skillshare', 'masterclass', 'udemy', 'coursera', 'brilliant',
+    'audible', 'spotify', 'amazon', 'shopify', 'squarespace',
+    'wix', 'bluehost', 'hostinger', 'godaddy', 'namecheap',
+    'grammarly', 'honey', 'raid', 'mobile legends', 'genshin impact',
+    'raycon', 'airpods', 'samsung', 'apple', 'google',
+    'microsoft', 'adobe', 'canva', 'figma', 'notion',
+    'robinhood', 'coinbase', 'binance', 'stripe', 'paypal',
+    'uber', 'lyft', 'doordash', 'ubereats', 'grubhub',
+    'netflix', 'disney+', 'hulu', 'hbo max', 'paramount+',
+    'nike', 'adidas', 'puma', 'under armour', 'reebok',
+    'coca cola', 'pepsi', 'red bull', 'monster', 'gatorade',
+    'mcdonalds', 'burger king', 'kfc', 'subway', 'dominos',
+    'starbucks', 'dunkin', 'tim hortons', 'peets', 'caribou'
+)
+
+_SPONSOR_COMPANY_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'(?:sponsored by|partnered with|thanks to)\s+([A-Z][a-zA-Z\s&]+?)(?:\s+for|\.|,|$)',
+    r'check out ([A-Z][a-zA-Z\s&]+?)(?:\s+at|\.|,|$)',
+    r'visit ([A-Z][a-zA-Z\s&]+?)(?:\s+com|\.|,|$)',
+    r'go to ([A-Z][a-zA-Z\s&]+?)(?:\s+com|\.|,|$)',
+    r'head over to ([A-Z][a-zA-Z\s&]+?)(?:\s+com|\.|,|$)'
+]]
+
+_DISCOUNT_CODE_RE = re.compile(r'(?:use|promo|discount|coupon)\s+code\s+([A-Z0-9]+)', re.IGNORECASE)
+_URL_RE = re.compile(r'https?://[^\s]+')
+
+# Sentences that carry the sponsorship read
+_SPONSOR_SEGMENT_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'[^.]*(?:sponsored by|partnered with|thanks to)[^.]*\.',
+    r'[^.]*(?:check out|visit|go to|head over to)[^.]*\.',
+    r'[^.]*(?:use code|promo code|discount code)[^.]*\.',
+    r'[^.]*(?:link in description|click the link)[^.]*\.'
+]]
+
 # Download required NLTK data
 try:
     nltk.data.find('vader_lexicon')
@@ -31,12 +95,22 @@ except LookupError:
 class EnhancedYouTubeService:
     """Enhanced YouTube service with transcript and advanced analytics capabilities."""
     
+    # VADER lexicon is parsed once per process and shared by every instance
+    _sia = None
+    _sia_lock = threading.Lock()
+    
     def __init__(self, api_key: str):
         self.api_keys = [api_key]  # Primary API key
         self.current_key_index = 0
         self.api_key = api_key
-        self.youtube = build("youtube", "v3", developerKey=api_key)
-        self.sia = SentimentIntensityAnalyzer()
+        self._local = threading.local()
+        self._get_client()  # Build the client for the constructing thread up front
+        
+        # Fetched video info and transcripts, shared by all agent operations
+        self._video_info_cache = TTLCache(maxsize=2048, ttl=3600)
+        self._transcript_cache = TTLCache(maxsize=2048, ttl=3600)
+        self._comments_cache = TTLCache(maxsize=256, ttl=900)  # Lists of up to 1000 comments each
+        self._cache_lock = threading.Lock()
         
         # Enhanced sarcasm detection
         self.negative_context_keywords = [
@@ -61,6 +135,30 @@ class EnhancedYouTubeService:
             r'\b(do you|does it|is it|are you)\b'
         ]
     
+    @classmethod
+    def shared_sia(cls) -> SentimentIntensityAnalyzer:
+        """Lazily create the process-wide VADER analyzer."""
+        if cls._sia is None:
+            with cls._sia_lock:
+                if cls._sia is None:
+                    cls._sia = SentimentIntensityAnalyzer()
+        return cls._sia
+    
+    @property
+    def sia(self) -> SentimentIntensityAnalyzer:
+        return self.shared_sia()
+    
+    @property
+    def youtube(self):
+        return self._get_client()
+    
+    def _get_client(self):
+        """YouTube API client for the calling thread (httplib2 transports are not thread-safe)"""
+        if getattr(self._local, 'api_key', None) != self.api_key:
+            self._local.youtube = build("youtube", "v3", developerKey=self.api_key)
+            self._local.api_key = self.api_key
+        return self._local.youtube
+    
     def add_api_key(self, api_key: str):
         """Add an additional API key for rotation"""
         if api_key not in self.api_keys:
@@ -71,8 +169,7 @@ class EnhancedYouTubeService:
         """Rotate to the next available API key"""
         if len(self.api_keys) > 1:
             self.current_key_index = (self.current_key_index + 1) % len(self.api_keys)
-            self.api_key = self.api_keys[self.current_key_index]
-            self.youtube = build("youtube", "v3", developerKey=self.api_key)
+            self.api_key = self.api_keys[self.current_key_index]  # Clients rebuild lazily per thread
             logger.info(f"Rotated to API key {self.current_key_index + 1}/{len(self.api_keys)}")
             return True
         return False
@@ -123,6 +220,11 @@ class EnhancedYouTubeService:
     
     def get_video_info(self, video_id: str) -> Optional[Dict[str, Any]]:
         """Get comprehensive video information."""
+        with self._cache_lock:
+            cached = self._video_info_cache.get(video_id)
+        if cached is not None:
+            return cached
+        
         try:
             request = self.youtube.videos().list(
                 part="snippet,statistics,contentDetails",
@@ -131,33 +233,75 @@ class EnhancedYouTubeService:
             response = request.execute()
             
             if response['items']:
-                video = response['items'][0]
-                snippet = video['snippet']
-                statistics = video['statistics']
-                content_details = video['contentDetails']
-                
-                return {
-                    'title': snippet['title'],
-                    'description': snippet['description'][:500] + '...' if len(snippet['description']) > 500 else snippet['description'],
-                    'channel': snippet['channelTitle'],
-                    'channel_id': snippet['channelId'],
-                    'published_at': snippet['publishedAt'],
-                    'view_count': int(statistics.get('viewCount', 0)),
-                    'like_count': int(statistics.get('likeCount', 0)),
-                    'comment_count': int(statistics.get('commentCount', 0)),
-                    'thumbnail': snippet['thumbnails']['medium']['url'],
-                    'duration': content_details['duration'],
-                    'tags': snippet.get('tags', []),
-                    'category_id': snippet.get('categoryId'),
-                    'default_language': snippet.get('defaultLanguage'),
-                    'default_audio_language': snippet.get('defaultAudioLanguage')
-                }
+                info = self._parse_video_item(response['items'][0])
+                with self._cache_lock:
+                    self._video_info_cache[video_id] = info
+                return info
         except Exception as e:
             logger.error(f"Error fetching video info: {e}")
             return None
     
+    def _uncached_video_ids(self, video_ids: List[str]) -> tuple:
+        """Split video IDs into cached info and the unique IDs still to fetch."""
+        with self._cache_lock:
+            found = {video_id: self._video_info_cache[video_id] for video_id in video_ids if video_id in self._video_info_cache}
+        missing = [video_id for video_id in dict.fromkeys(video_ids) if video_id not in found]
+        return found, missing
+    
+    def _store_video_items(self, items: List[Dict[str, Any]], found: Dict[str, Dict[str, Any]]):
+        """Parse videos.list items into found and the cache."""
+        with self._cache_lock:
+            for item in items:
+                info = self._parse_video_item(item)
+                self._video_info_cache[item['id']] = info
+                found[item['id']] = info
+    
+    def get_videos_info(self, video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get video information for many videos, one videos.list call per 50 IDs."""
+        found, missing = self._uncached_video_ids(video_ids)
+        for start in range(0, len(missing), VIDEOS_LIST_MAX_IDS):
+            try:
+                response = self.youtube.videos().list(
+                    part="snippet,statistics,contentDetails",
+                    id=",".join(missing[start:start + VIDEOS_LIST_MAX_IDS])
+                ).execute()
+                self._store_video_items(response.get('items', []), found)
+            except Exception as e:
+                logger.error(f"Error fetching video info batch: {e}")
+        return found
+    
+    @staticmethod
+    def _parse_video_item(video: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten a videos.list item into the video info dict."""
+        snippet = video['snippet']
+        statistics = video['statistics']
+        content_details = video['contentDetails']
+        
+        return {
+            'title': snippet['title'],
+            'description': snippet['description'][:500] + '...' if len(snippet['description']) > 500 else snippet['description'],
+            'channel': snippet['channelTitle'],
+            'channel_id': snippet['channelId'],
+            'published_at': snippet['publishedAt'],
+            'view_count': int(statistics.get('viewCount', 0)),
+            'like_count': int(statistics.get('likeCount', 0)),
+            'comment_count': int(statistics.get('commentCount', 0)),
+            'thumbnail': snippet['thumbnails']['medium']['url'],
+            'duration': content_details['duration'],
+            'tags': snippet.get('tags', []),
+            'category_id': snippet.get('categoryId'),
+            'default_language': snippet.get('defaultLanguage'),
+            'default_audio_language': snippet.get('defaultAudioLanguage')
+        }
+    
     def get_comments(self, video_id: str, max_results: int = 1000) -> List[Dict[str, Any]]:
         """Fetch and analyze comments from a YouTube video."""
+        cache_key = (video_id, max_results)
+        with self._cache_lock:
+            cached = self._comments_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         comments = []
         next_page_token = None
         
@@ -229,6 +373,10 @@ class EnhancedYouTubeService:
                 next_page_token = response.get('nextPageToken')
                 if not next_page_token:
                     break
+            
+            # Only complete fetches are cached
+            with self._cache_lock:
+                self._comments_cache[cache_key] = comments
                     
         except HttpError as e:
             if e.resp.status == 403:
@@ -242,10 +390,17 @@ class EnhancedYouTubeService:
     
     def get_transcript(self, video_id: str) -> Optional[str]:
         """Get video transcript using YouTube Transcript API."""
+        with self._cache_lock:
+            cached = self._transcript_cache.get(video_id)
+        if cached is not None:
+            return cached
+        
         try:
             transcript_list = YouTubeTranscriptApi.get_transcript(video_id)
             formatter = TextFormatter()
             transcript = formatter.format_transcript(transcript_list)
+            with self._cache_lock:
+                self._transcript_cache[video_id] = transcript
             return transcript
         except Exception as e:
             logger.error(f"Error fetching transcript: {e}")
@@ -388,27 +543,31 @@ class EnhancedYouTubeService:
             response = request.execute()
             
             if response['items']:
-                channel = response['items'][0]
-                snippet = channel['snippet']
-                statistics = channel['statistics']
-                
-                return {
-                    'id': channel['id'],
-                    'title': snippet['title'],
-                    'description': snippet['description'],
-                    'custom_url': snippet.get('customUrl'),
-                    'published_at': snippet['publishedAt'],
-                    'thumbnail': snippet['thumbnails']['medium']['url'],
-                    'subscriber_count': int(statistics.get('subscriberCount', 0)),
-                    'video_count': int(statistics.get('videoCount', 0)),
-                    'view_count': int(statistics.get('viewCount', 0)),
-                    'country': snippet.get('country'),
-                    'default_language': snippet.get('defaultLanguage')
-                }
+                return self._parse_channel_item(response['items'][0])
         except Exception as e:
             logger.error(f"Error fetching channel info: {e}")
             return None
     
+    @staticmethod
+    def _parse_channel_item(channel: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten a channels.list item into the channel info dict."""
+        snippet = channel['snippet']
+        statistics = channel['statistics']
+        
+        return {
+            'id': channel['id'],
+            'title': snippet['title'],
+            'description': snippet['description'],
+            'custom_url': snippet.get('customUrl'),
+            'published_at': snippet['publishedAt'],
+            'thumbnail': snippet['thumbnails']['medium']['url'],
+            'subscriber_count': int(statistics.get('subscriberCount', 0)),
+            'video_count': int(statistics.get('videoCount', 0)),
+            'view_count': int(statistics.get('viewCount', 0)),
+            'country': snippet.get('country'),
+            'default_language': snippet.get('defaultLanguage')
+        }
+    
     def get_video_analytics(self, video_id: str) -> Dict[str, Any]:
         """Get comprehensive video analytics."""
         try:
@@ -468,14 +627,9 @@ class EnhancedYouTubeService:
             logger.error(f"Error getting video analytics: {e}")
             return {}
     
-    def get_video_comments(self, video_id: str, max_results: int = 1000) -> List[Dict[str, Any]]:
-        """Alias for get_comments method for compatibility with AnalyticsAgent."""
-        print(f"DEBUG: get_video_comments called with video_id: {video_id}")  # Debug print
-        return self.get_comments(video_id, max_results)
-    
-    def get_video_transcript(self, video_id: str) -> Optional[str]:
-        """Get video transcript - alias for get_transcript method."""
-        return self.get_transcript(video_id)
+    # Aliases used by AnalyticsAgent
+    get_video_comments = get_comments
+    get_video_transcript = get_transcript
 
     def get_channel_videos(self, channel_id: str, max_results: int = 50) -> List[Dict[str, Any]]:
         """Get recent videos from a channel."""
@@ -561,82 +715,33 @@ class EnhancedYouTubeService:
     def detect_sponsorships(self, transcript: str, title: str = "", description: str = "") -> Dict[str, Any]:
         """Detect sponsorships in video transcript, title, and description."""
         try:
-            # Common sponsorship indicators
-            sponsorship_indicators = [
-                r'sponsored\s+by',
-                r'this\s+video\s+is\s+sponsored\s+by',
-                r'thanks\s+to\s+.*?\s+for\s+sponsoring',
-                r'partnered\s+with',
-                r'in\s+partnership\s+with',
-                r'promotion\s+code',
-                r'discount\s+code',
-                r'use\s+code\s+[A-Z0-9]+',
-                r'promo\s+code',
-                r'coupon\s+code',
-                r'check\s+out\s+.*?\s+link\s+in\s+description',
-                r'link\s+in\s+description',
-                r'click\s+the\s+link\s+below',
-                r'visit\s+.*?\s+com',
-                r'go\s+to\s+.*?\s+com',
-                r'head\s+over\s+to',
-                r'check\s+out\s+.*?\s+website',
-                r'visit\s+.*?\s+website',
-                r'go\s+to\s+.*?\s+website'
-            ]
-            
-            # Common sponsorship companies and brands
-            sponsorship_companies = [
-                'nordvpn', 'expressvpn', 'surfshark', 'protonvpn', 'cyberghost',
-                'skillshare', 'masterclass', 'udemy', 'coursera', 'brilliant',
-                'audible', 'spotify', 'amazon', 'shopify', 'squarespace',
-                'wix', 'bluehost', 'hostinger', 'godaddy', 'namecheap',
-                'grammarly', 'honey', 'raid', 'mobile legends', 'genshin impact',
-                'raycon', 'airpods', 'samsung', 'apple', 'google',
-                'microsoft', 'adobe', 'canva', 'figma', 'notion',
-                'robinhood', 'coinbase', 'binance', 'stripe', 'paypal',
-                'uber', 'lyft', 'doordash', 'ubereats', 'grubhub',
-                'netflix', 'disney+', 'hulu', 'hbo max', 'paramount+',
-                'nike', 'adidas', 'puma', 'under armour', 'reebok',
-                'coca cola', 'pepsi', 'red bull', 'monster', 'gatorade',
-                'mcdonalds', 'burger king', 'kfc', 'subway', 'dominos',
-                'starbucks', 'dunkin', 'tim hortons', 'peets', 'caribou'
-            ]
-            
-            # Combine all text for analysis
-            full_text = f"{title} {description} {transcript}".lower()
+            # Combine all text once; matching runs on the lowercased copy
+            raw_text = f"{title} {description} {transcript}"
+            full_text = raw_text.lower()
             
             # Detect sponsorship indicators
             detected_indicators = []
-            for pattern in sponsorship_indicators:
-                matches = re.findall(pattern, full_text, re.IGNORECASE)
+            for pattern in _SPONSOR_INDICATOR_PATTERNS:
+                matches = pattern.findall(full_text)
                 if matches:
                     detected_indicators.extend(matches)
             
             # Detect sponsorship companies
             detected_companies = []
-            for company in sponsorship_companies:
-                if company.lower() in full_text:
+            for company in _SPONSOR_COMPANIES:
+                if company in full_text:
                     detected_companies.append(company)
             
-            # Extract potential company names using regex patterns
-            company_patterns = [
-                r'(?:sponsored by|partnered with|thanks to)\s+([A-Z][a-zA-Z\s&]+?)(?:\s+for|\.|,|$)',
-                r'check out ([A-Z][a-zA-Z\s&]+?)(?:\s+at|\.|,|$)',
-                r'visit ([A-Z][a-zA-Z\s&]+?)(?:\s+com|\.|,|$)',
-                r'go to ([A-Z][a-zA-Z\s&]+?)(?:\s+com|\.|,|$)',
-                r'head over to ([A-Z][a-zA-Z\s&]+?)(?:\s+com|\.|,|$)'
-            ]
-            
             extracted_companies = []
-            for pattern in company_patterns:
-                matches = re.findall(pattern, full_text, re.IGNORECASE)
+            for pattern in _SPONSOR_COMPANY_PATTERNS:
+                matches = pattern.findall(full_text)
                 extracted_companies.extend([match.strip() for match in matches])
             
             # Extract discount codes
-            discount_codes = re.findall(r'(?:use|promo|discount|coupon)\s+code\s+([A-Z0-9]+)', full_text, re.IGNORECASE)
+            discount_codes = _DISCOUNT_CODE_RE.findall(full_text)
             
             # Extract URLs
-            urls = re.findall(r'https?://[^\s]+', full_text)
+            urls = _URL_RE.findall(full_text)
             
             # Determine sponsorship confidence
             confidence_score = 0
@@ -668,7 +773,7 @@ class EnhancedYouTubeService:
                 "extracted_companies": list(set(extracted_companies)),
                 "discount_codes": list(set(discount_codes)),
                 "urls": list(set(urls)),
-                "sponsorship_text": self.extract_sponsorship_text(transcript, title, description)
+                "sponsorship_text": self._sponsorship_segments(raw_text)
             }
             
         except Exception as e:
@@ -688,26 +793,18 @@ class EnhancedYouTubeService:
     def extract_sponsorship_text(self, transcript: str, title: str = "", description: str = "") -> List[str]:
         """Extract specific text segments that indicate sponsorship."""
         try:
-            sponsorship_segments = []
-            full_text = f"{title} {description} {transcript}"
-            
-            # Patterns to extract sponsorship segments
-            patterns = [
-                r'[^.]*(?:sponsored by|partnered with|thanks to)[^.]*\.',
-                r'[^.]*(?:check out|visit|go to|head over to)[^.]*\.',
-                r'[^.]*(?:use code|promo code|discount code)[^.]*\.',
-                r'[^.]*(?:link in description|click the link)[^.]*\.'
-            ]
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, full_text, re.IGNORECASE)
-                sponsorship_segments.extend(matches)
-            
-            return list(set(sponsorship_segments))
-            
+            return self._sponsorship_segments(f"{title} {description} {transcript}")
         except Exception as e:
             logger.error(f"Error extracting sponsorship text: {e}")
             return []
+    
+    @staticmethod
+    def _sponsorship_segments(full_text: str) -> List[str]:
+        """Unique sentences in already-combined text that carry a sponsorship read."""
+        sponsorship_segments = []
+        for pattern in _SPONSOR_SEGMENT_PATTERNS:
+            sponsorship_segments.extend(pattern.findall(full_text))
+        return list(set(sponsorship_segments))
 
     def get_video_tags(self, video_id: str) -> List[str]:
         """Get video tags from YouTube API."""
@@ -734,8 +831,8 @@ class EnhancedYouTubeService:
             if not original_video:
                 return {"error": "Original video not found"}
             
-            # Get video tags
-            video_tags = self.get_video_tags(video_id)
+            # Video tags come with the video info
+            video_tags = original_video.get('tags', [])
             
             # Create search keywords from title and tags, excluding channel name
             search_keywords = original_video['title']
@@ -774,6 +871,9 @@ class EnhancedYouTubeService:
             analyzed_videos = []
             original_channel_id = original_video.get('channel_id', '')
             
+            # Warm the video info cache with one batched videos.list call
+            self.get_videos_info([video['id'] for video in similar_videos if video['id'] != video_id])
+            
             for video in similar_videos:
                 if video['id'] == video_id:  # Skip the original video
                     continue
@@ -831,7 +931,7 @@ class EnhancedYouTubeService:
                     break
             
             # Sort by relevance (engagement rate and view count)
-            analyzed_videos.sort(key=lambda x: (x['engagement_rate'], x['view_count']), reverse=True)
+            analyzed_videos.sort(key=itemgetter('engagement_rate', 'view_count'), reverse=True)
             
             # Generate technical insights
             technical_insights = self.analyze_technical_insights(original_video, analyzed_videos)
@@ -889,7 +989,7 @@ class EnhancedYouTubeService:
                 "sponsored_videos": len(sponsored_videos),
                 "sponsorship_rate": round((len(sponsored_videos) / total_videos * 100), 2) if total_videos > 0 else 0,
                 "sponsorship_levels": sponsorship_levels,
-                "top_sponsors": sorted(company_frequency.items(), key=lambda x: x[1], reverse=True)[:10],
+                "top_sponsors": heapq.nlargest(10, company_frequency.items(), key=itemgetter(1)),
                 "discount_codes": list(set(all_codes)),
                 "common_sponsorship_indicators": self.get_common_sponsorship_indicators(videos)
             }
@@ -912,7 +1012,7 @@ class EnhancedYouTubeService:
                 indicator_frequency[indicator] = indicator_frequency.get(indicator, 0) + 1
             
             # Return top indicators
-            return sorted(indicator_frequency.items(), key=lambda x: x[1], reverse=True)[:5]
+            return heapq.nlargest(5, indicator_frequency.items(), key=itemgetter(1))
             
         except Exception as e:
             logger.error(f"Error getting common sponsorship indicators: {e}")
@@ -1052,7 +1152,7 @@ class EnhancedYouTubeService:
                         patterns["common_keywords"][word] = patterns["common_keywords"].get(word, 0) + 1
             
             # Sort keywords by frequency
-            patterns["common_keywords"] = dict(sorted(patterns["common_keywords"].items(), key=lambda x: x[1], reverse=True)[:10])
+            patterns["common_keywords"] = dict(heapq.nlargest(10, patterns["common_keywords"].items(), key=itemgetter(1)))
             
             return patterns
             
@@ -1090,7 +1190,7 @@ class EnhancedYouTubeService:
                     })
             
             # Sort tags by frequency
-            patterns["most_common_tags"] = dict(sorted(patterns["most_common_tags"].items(), key=lambda x: x[1], reverse=True)[:15])
+            patterns["most_common_tags"] = dict(heapq.nlargest(15, patterns["most_common_tags"].items(), key=itemgetter(1)))
             
             return patterns
             
@@ -1217,7 +1317,7 @@ class EnhancedYouTubeService:
                 patterns["sponsorship_impact"]["engagement_difference"] = round(diff, 2)
             
             # Sort top sponsors
-            patterns["top_sponsors"] = dict(sorted(patterns["top_sponsors"].items(), key=lambda x: x[1], reverse=True)[:5])
+            patterns["top_sponsors"] = dict(heapq.nlargest(5, patterns["top_sponsors"].items(), key=itemgetter(1)))
             
             return patterns
             
@@ -1280,7 +1380,7 @@ class EnhancedYouTubeService:
             }
             
             # Analyze top performing videos
-            top_videos = sorted(similar_videos, key=lambda x: x.get('engagement_rate', 0), reverse=True)[:3]
+            top_videos = heapq.nlargest(3, similar_videos, key=lambda x: x.get('engagement_rate', 0))
             
             for video in top_videos:
                 title = video.get('title', '')
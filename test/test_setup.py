@@ -113,13 +113,13 @@ def test_imports():
         import vaderSentiment
         
         # Test our custom modules
-        sys.path.append('src')
-        from services.ai_service import AIService
-        from agents.base_agent import BaseAgent
-        from agents.analytics_agent import AnalyticsAgent
-        from agents.content_agent import ContentAgent
-        from agents.critique_agent import CritiqueAgent
-        from agents.orchestrator_agent import OrchestratorAgent
+        sys.path.append('.')
+        from src.services.ai_service import AIService
+        from src.agents.base_agent import BaseAgent
+        from src.agents.analytics_agent import AnalyticsAgent
+        from src.agents.content_agent import ContentAgent
+        from src.agents.critique_agent import CritiqueAgent
+        from src.agents.orchestrator_agent import OrchestratorAgent
         
         print("✅ All imports successful")
         return True
@@ -128,13 +128,32 @@ def test_imports():
         print(f"❌ Import failed: {e}")
         return False
 
+def test_base_agent_identity():
+    """Test BaseAgent is a single class loaded from the src package"""
+    print("🧬 Testing BaseAgent identity...")
+    
+    try:
+        import inspect
+        sys.path.append('.')
+        from src.agents.base_agent import BaseAgent
+        
+        assert BaseAgent.__module__ == "src.agents.base_agent", BaseAgent.__module__
+        model_name = inspect.signature(BaseAgent.__init__).parameters['model_name']
+        assert model_name.default is None, model_name.default
+        print("✅ BaseAgent identity correct")
+        return True
+        
+    except Exception as e:
+        print(f"❌ BaseAgent identity check failed: {e}")
+        return False
+
 def test_agent_initialization():
     """Test agent initialization"""
     print("🤖 Testing agent initialization...")
     
     try:
-        sys.path.append('src')
-        from agents.orchestrator_agent import OrchestratorAgent
+        sys.path.append('.')
+        from src.agents.orchestrator_agent import OrchestratorAgent
         
         # Test agent initialization
         orchestrator = OrchestratorAgent()
@@ -150,8 +169,8 @@ def test_ai_service():
     print("🧠 Testing AI service...")
     
     try:
-        sys.path.append('src')
-        from services.ai_service import AIService
+        sys.path.append('.')
+        from src.services.ai_service import AIService
         
         # Test AI service initialization
         ai_service = AIService()
@@ -180,6 +199,7 @@ def main():
         ("Ollama Connection", test_ollama_connection),
         ("YouTube API", test_youtube_api),
         ("Imports", test_imports),
+        ("BaseAgent Identity", test_base_agent_identity),
         ("Agent Initialization", test_agent_initialization),
         ("AI Service", test_ai_service),
     ]
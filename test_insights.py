@@ -9,14 +9,14 @@ import json
 import time
 from datetime import datetime
 
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+# Add the repo root to path so agents resolve through the src package
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from services.youtube_service import EnhancedYouTubeService
-from agents.analytics_agent import AnalyticsAgent
-from agents.critique_agent import CritiqueAgent
-from agents.content_agent import ContentAgent
-from agents.orchestrator_agent import OrchestratorAgent
+from src.services.youtube_service import EnhancedYouTubeService
+from src.agents.analytics_agent import AnalyticsAgent
+from src.agents.critique_agent import CritiqueAgent
+from src.agents.content_agent import ContentAgent
+from src.agents.orchestrator_agent import OrchestratorAgent
 
 def load_env():
     """Load environment variables"""